@@ -0,0 +1,229 @@
+import math
+import numpy as np
+import pandas as pd
+
+
+# ============================================
+# INTERVALLES DE CONFIANCE (BOOTSTRAP)
+# ============================================
+
+def bootstrap_ci(values, statistic='mean', n_resamples=2000, confidence=0.95, seed=0):
+    """
+    Intervalle de confiance bootstrap (percentiles) d'une statistique.
+
+    Les n_resamples rééchantillonnages sont tirés en une seule matrice
+    (n_resamples × n) ; avec un seul échantillon l'intervalle est réduit à
+    la valeur observée.
+
+    Args:
+        values: Observations (une par graine)
+        statistic: 'mean' ou 'median'
+        n_resamples: Nombre de rééchantillonnages
+        confidence: Niveau de confiance (0.95 : percentiles 2.5 et 97.5)
+        seed: Graine du tirage, pour des intervalles reproductibles
+
+    Returns:
+        (borne basse, borne haute)
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return float('nan'), float('nan')
+    if len(values) == 1:
+        return values[0].item(), values[0].item()
+    reduce = {'mean': np.mean, 'median': np.median}[statistic]
+    rng = np.random.default_rng(seed)
+    samples = values[rng.integers(0, len(values), size=(n_resamples, len(values)))]
+    estimates = reduce(samples, axis=1)
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(estimates, [alpha, 1 - alpha])
+    return low.item(), high.item()
+
+
+def summarize_runs(df, metrics=('makespan', 'execution_time'), n_resamples=2000, confidence=0.95):
+    """
+    Moyenne et médiane de chaque métrique sur les graines de chaque couple
+    (instance, algorithme), avec leurs intervalles de confiance bootstrap.
+
+    Returns:
+        DataFrame : une ligne par (instance_id, algorithm), colonnes n_runs,
+        <métrique>_mean, <métrique>_mean_ci_low, <métrique>_mean_ci_high,
+        <métrique>_median, <métrique>_median_ci_low, <métrique>_median_ci_high
+    """
+    rows = []
+    for (instance_id, algorithm), group in df.groupby(['instance_id', 'algorithm'], sort=False):
+        row = {'instance_id': instance_id, 'algorithm': algorithm, 'n_runs': len(group)}
+        for metric in metrics:
+            values = group[metric].to_numpy(dtype=float)
+            for statistic in ('mean', 'median'):
+                low, high = bootstrap_ci(values, statistic, n_resamples, confidence)
+                row[f'{metric}_{statistic}'] = getattr(np, statistic)(values).item()
+                row[f'{metric}_{statistic}_ci_low'] = low
+                row[f'{metric}_{statistic}_ci_high'] = high
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def has_repeated_runs(df):
+    """Vrai si un couple (instance, algorithme) a plusieurs exécutions (graines)"""
+    return bool(df.duplicated(['instance_id', 'algorithm']).any())
+
+
+def aggregate_runs(df):
+    """
+    Une ligne par (instance, algorithme) : médiane des colonnes numériques sur
+    les graines, première valeur pour les autres (description, progression...),
+    plus petite position dans la suite pour job_index.
+    La colonne 'seed' est remplacée par 'n_runs'.
+    """
+    columns = [column for column in df.columns if column not in ('instance_id', 'algorithm', 'seed')]
+    aggregations = {
+        column: 'min' if column == 'job_index'
+        else 'median' if pd.api.types.is_numeric_dtype(df[column]) and not pd.api.types.is_bool_dtype(df[column])
+        else 'first'
+        for column in columns
+    }
+    grouped = df.groupby(['instance_id', 'algorithm'], sort=False)
+    aggregated = grouped.agg(aggregations)
+    aggregated['n_runs'] = grouped.size()
+    return aggregated.reset_index()
+
+
+# ============================================
+# TESTS APPARIÉS (WILCOXON)
+# ============================================
+
+def wilcoxon_signed_rank(x, y):
+    """
+    Test des rangs signés de Wilcoxon (bilatéral) sur les paires (x_i, y_i).
+
+    Utilise scipy.stats.wilcoxon si SciPy est installé, sinon
+    l'approximation normale avec correction de continuité et des ex aequo.
+    Les différences nulles sont écartées (méthode de Wilcoxon).
+
+    Returns:
+        (statistique W, p-value, nombre de paires non nulles) ; p-value à
+        1.0 si toutes les différences sont nulles
+    """
+    differences = np.asarray(x, dtype=float) - np.asarray(y, dtype=float)
+    differences = differences[~np.isnan(differences) & (differences != 0)]
+    n = len(differences)
+    if n == 0:
+        return 0.0, 1.0, 0
+    try:
+        from scipy.stats import wilcoxon
+    except ImportError:
+        wilcoxon = None
+    if wilcoxon is not None:
+        result = wilcoxon(differences)
+        return float(result.statistic), float(result.pvalue), n
+
+    ranks = pd.Series(np.abs(differences)).rank(method='average').to_numpy()
+    w_plus = ranks[differences > 0].sum()
+    w_minus = ranks[differences < 0].sum()
+    _, tie_counts = np.unique(ranks, return_counts=True)
+    mean = n * (n + 1) / 4
+    variance = n * (n + 1) * (2 * n + 1) / 24 - (tie_counts ** 3 - tie_counts).sum() / 48
+    if variance <= 0:
+        return float(min(w_plus, w_minus)), 1.0, n
+    z = (abs(w_plus - mean) - 0.5) / math.sqrt(variance)
+    p_value = math.erfc(max(z, 0.0) / math.sqrt(2))
+    return float(min(w_plus, w_minus)), min(p_value, 1.0), n
+
+
+def paired_tests(df, metric='makespan', reference=None, alpha=0.05):
+    """
+    Compare chaque algorithme à l'algorithme de référence sur `metric`, en
+    appariant par instance (médiane sur les graines si plusieurs exécutions).
+    Seules les instances résolues par les deux algorithmes sont comparées.
+
+    Args:
+        reference: Algorithme de référence (par défaut : meilleure médiane)
+        alpha: Seuil de significativité
+
+    Returns:
+        DataFrame indexé par algorithme : victoires / égalités / défaites
+        face à la référence (plus petit = meilleur), W, p-value, significatif
+    """
+    per_instance = df.pivot_table(index='instance_id', columns='algorithm', values=metric, aggfunc='median')
+    if reference is None:
+        reference = per_instance.median().idxmin()
+    rows = {}
+    for algorithm in per_instance.columns:
+        pairs = per_instance[[algorithm, reference]].dropna().to_numpy()
+        values, reference_values = pairs[:, 0], pairs[:, -1]
+        if algorithm == reference:
+            statistic, p_value, _ = float('nan'), float('nan'), 0
+        else:
+            statistic, p_value, _ = wilcoxon_signed_rank(values, reference_values)
+        rows[algorithm] = {
+            'reference': reference,
+            'n_instances': len(pairs),
+            'wins': int((values < reference_values).sum()),
+            'ties': int((values == reference_values).sum()),
+            'losses': int((values > reference_values).sum()),
+            'wilcoxon_W': statistic,
+            'p_value': p_value,
+            'significant': bool(p_value < alpha) if not math.isnan(p_value) else False,
+        }
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+# ============================================
+# AJUSTEMENT DE COMPLEXITÉ EMPIRIQUE
+# ============================================
+
+def _t_quantile(probability, dof):
+    """Quantile de la loi de Student (SciPy si installé, sinon développement de Cornish-Fisher)"""
+    try:
+        from scipy.stats import t
+    except ImportError:
+        t = None
+    if t is not None:
+        return float(t.ppf(probability, dof))
+    from statistics import NormalDist
+    z = NormalDist().inv_cdf(probability)
+    return (z + (z ** 3 + z) / (4 * dof) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3))
+
+
+def fit_power_law(n_tasks, n_servers, times, confidence=0.95):
+    """
+    Ajuste time ≈ c · n^a · m^b par moindres carrés sur les logarithmes.
+
+    Un exposant dont la variable ne varie pas dans les données n'est pas
+    identifiable : il vaut NaN et n'entre pas dans la régression.
+
+    Returns:
+        dict (c, a, b, intervalles de confiance a_ci / b_ci issus de la loi de
+        Student, r2, n_points), ou None s'il y a trop peu de points
+    """
+    log_times = np.log(np.asarray(times, dtype=float))
+    columns = [np.ones_like(log_times)]
+    names = []
+    for name, values in (('a', n_tasks), ('b', n_servers)):
+        log_values = np.log(np.asarray(values, dtype=float))
+        if np.ptp(log_values) > 0:
+            columns.append(log_values)
+            names.append(name)
+    design = np.column_stack(columns)
+    dof = len(log_times) - design.shape[1]
+    if not names or dof < 1:
+        return None
+
+    coefficients, *_ = np.linalg.lstsq(design, log_times, rcond=None)
+    residuals = log_times - design @ coefficients
+    residual_variance = residuals @ residuals / dof
+    standard_errors = np.sqrt(np.diag(residual_variance * np.linalg.pinv(design.T @ design)))
+    margin = _t_quantile(1 - (1 - confidence) / 2, dof)
+    total = ((log_times - log_times.mean()) ** 2).sum()
+
+    fit = {'c': math.exp(coefficients[0]), 'a': float('nan'), 'b': float('nan'),
+           'a_ci': (float('nan'), float('nan')), 'b_ci': (float('nan'), float('nan')),
+           'r2': 1 - (residuals @ residuals) / total if total > 0 else 1.0,
+           'n_points': len(log_times)}
+    for name, coefficient, standard_error in zip(names, coefficients[1:], standard_errors[1:]):
+        fit[name] = coefficient.item()
+        fit[f'{name}_ci'] = ((coefficient - margin * standard_error).item(),
+                             (coefficient + margin * standard_error).item())
+    return fit
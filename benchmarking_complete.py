@@ -1,7 +1,12 @@
+import hashlib
+import inspect
 import json
+import os
+import re
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from typing import List, Dict
 import warnings
@@ -9,112 +14,501 @@ warnings.filterwarnings('ignore')
 
 # Importer les algorithmes (à partir du fichier précédent)
 from load_balancing_algorithms import *
+from instance_store import InstanceStore
+from benchmark_stats import aggregate_runs, has_repeated_runs, paired_tests, summarize_runs
+from figures import MAX_PLOT_POINTS, downsample_progress, pyplot, render_figures
+
+# Courbes de progression : au plus 2000 points par job (voir ProgressRecorder)
+DEFAULT_PROGRESS = {'max_points': 2000}
+
 
 def load_benchmark_data(filename='load_balancing_benchmark.json'):
-    """Charge les données de benchmark"""
-    with open(filename, 'r') as f:
-        return json.load(f)
+    """
+    Charge les données de benchmark : suite JSON, ou manifeste de grandes
+    instances (fichier ou dossier) dont les durées sont projetées à la demande
+    """
+    return InstanceStore(filename)
+
+class JobCheckpoint:
+    """
+    Sauvegarde des jobs terminés : un fichier JSON par job (instance,
+    algorithme, empreinte des paramètres et options, graine comprise),
+    écrit dès la fin du job. Une exécution interrompue reprend en sautant
+    les jobs déjà présents.
+    """
+    def __init__(self, directory='benchmark_checkpoint'):
+        self.directory = directory
+        self.location = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def key(self, instance, algo_name, params, options=None):
+        # Identifiant d'instance et algorithme lisibles, puis empreinte courte des paramètres et options
+        slug = re.sub(r'[^A-Za-z0-9]+', '_', algo_name).strip('_')
+        return f"{instance['id']}__{slug}__{job_digest(params, options)}"
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def load(self, key):
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def save(self, key, results):
+        # Écriture atomique : un job interrompu n'est jamais considéré terminé
+        tmp_path = self._path(key) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, default=_to_builtin)
+        os.replace(tmp_path, self._path(key))
+
+    def start_run(self):
+        """Rien à faire : un dossier de reprise n'enregistre pas les exécutions"""
+
+    def load_all(self, options_hash=None, latest=True):
+        """
+        Résultats sauvegardés (ordre de la suite, voir job_index) d'un seul jeu d'options :
+        options_hash s'il est donné, sinon celui du dernier job écrit
+        (latest=False : tous les résultats, toutes options confondues)
+        """
+        names = [name for name in os.listdir(self.directory) if name.endswith('.json')]
+        results = {name: self.load(name[:-len('.json')]) for name in names}
+        if options_hash is None and latest and names:
+            newest = max(names, key=lambda name: os.path.getmtime(self._path(name[:-len('.json')])))
+            options_hash = results[newest].get('options_hash')
+        if options_hash is not None:
+            results = {name: result for name, result in results.items()
+                       if result.get('options_hash', '').startswith(options_hash)}
+        return sorted((results[name] for name in sorted(results)), key=_job_order)
+
+
+def _job_order(results):
+    """Clé de tri : position du job dans la suite (instance, algorithme, graine), les anciens résultats en dernier"""
+    job_index = results.get('job_index')
+    return (job_index is None, job_index if job_index is not None else 0)
+
+
+def sort_results(df):
+    """Résultats dans l'ordre de la suite (instance, algorithme, graine), quel que soit l'ordre de terminaison"""
+    if 'job_index' not in df.columns:
+        return df
+    return df.sort_values('job_index', kind='stable', na_position='last').reset_index(drop=True)
+
+
+def job_digest(params, options=None):
+    """Empreinte courte (12 caractères) des paramètres et options d'évaluation d'un job"""
+    description = json.dumps({'params': params, 'options': options or {}}, sort_keys=True, default=_to_builtin)
+    return hashlib.sha256(description.encode()).hexdigest()[:12]
+
+
+def code_version():
+    """Empreinte du code des solveurs : un changement de code invalide les résultats stockés"""
+    digest = hashlib.sha256()
+    for module in ('load_balancing_algorithms.py', 'bounds.py'):
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), module), 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def instance_hash(instance):
+    """Empreinte du contenu d'une instance (durées et nombre de serveurs), quel que soit son format"""
+    durations = np.asarray(instance['tasks'])
+    dtype = np.int64 if np.issubdtype(durations.dtype, np.integer) else np.float64
+    digest = hashlib.sha256(np.ascontiguousarray(durations, dtype=dtype).tobytes())
+    digest.update(f"|{instance['n_servers']}".encode())
+    return digest.hexdigest()
+
 
-def run_complete_benchmark(benchmark_suite, algorithms):
+class ResultStore:
+    """
+    Stockage local des résultats dans une base SQLite, adressé par contenu :
+    la clé est l'empreinte de l'instance (durées, serveurs), de l'algorithme,
+    de ses paramètres (graine comprise), des options d'évaluation et de la
+    version du code. Relancer une suite ne recalcule que les clés absentes ;
+    une instance, un paramètre ou un solveur modifié change la clé.
+
+    Même interface que JobCheckpoint (key / load / save / load_all). Les
+    métriques principales sont des colonnes de la table ; le résultat complet
+    (progression comprise) est stocké en JSON.
+
+    Chaque ligne garde l'empreinte de ses options d'évaluation
+    (options_hash) et la dernière exécution qui l'a produite ou reprise
+    (run_id, voir start_run) : le rapport lit une seule exécution au lieu de
+    mélanger des budgets ou protocoles différents.
+    """
+    def __init__(self, path='benchmark_results.sqlite'):
+        self.path = path
+        self.location = path
+        self.version = code_version()
+        self.run_id = None
+        self._instance_hashes = {}
+        self._key_info = {}  # Clé -> (empreinte de l'instance, paramètres, options), pour les colonnes
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            """CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                instance_hash TEXT,
+                instance_id TEXT,
+                algorithm TEXT,
+                params TEXT,
+                code_version TEXT,
+                makespan REAL,
+                execution_time REAL,
+                optimality_gap REAL,
+                created_at REAL,
+                results TEXT,
+                options_hash TEXT,
+                run_id TEXT
+            )"""
+        )
+        # Bases créées avant les colonnes options_hash / run_id / job_index
+        columns = {row[1] for row in self._connection.execute('PRAGMA table_info(results)')}
+        for column, column_type in (('options_hash', 'TEXT'), ('run_id', 'TEXT'), ('job_index', 'INTEGER')):
+            if column not in columns:
+                self._connection.execute(f'ALTER TABLE results ADD COLUMN {column} {column_type}')
+        self._connection.commit()
+
+    def start_run(self):
+        """Ouvre une exécution : les lignes écrites ou reprises ensuite lui sont rattachées"""
+        self.run_id = f"{time.time():.6f}"
+        return self.run_id
+
+    def key(self, instance, algo_name, params, options=None):
+        memo_key = (instance['id'], id(instance))
+        if memo_key not in self._instance_hashes:
+            self._instance_hashes[memo_key] = instance_hash(instance)
+        description = json.dumps({
+            'instance': self._instance_hashes[memo_key],
+            'algorithm': algo_name,
+            'params': params,
+            'options': options or {},
+            'code_version': self.version,
+        }, sort_keys=True, default=_to_builtin)
+        key = hashlib.sha256(description.encode()).hexdigest()
+        self._key_info[key] = (self._instance_hashes[memo_key], json.dumps(params, sort_keys=True, default=_to_builtin),
+                               job_digest({}, options))
+        return key
+
+    def load(self, key):
+        row = self._connection.execute('SELECT results FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        if self.run_id is not None:
+            # Résultat repris : il fait partie de l'exécution courante
+            self._connection.execute('UPDATE results SET run_id = ? WHERE key = ?', (self.run_id, key))
+            self._connection.commit()
+        return json.loads(row[0])
+
+    def save(self, key, results):
+        instance_digest, params, options_hash = self._key_info.get(key, (None, None, None))
+        self._connection.execute(
+            'INSERT OR REPLACE INTO results (key, instance_hash, instance_id, algorithm, params, code_version, '
+            'makespan, execution_time, optimality_gap, created_at, results, options_hash, run_id, job_index) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (key, instance_digest, results.get('instance_id'), results.get('algorithm'), params, self.version, results.get('makespan'), results.get('execution_time'),
+             results.get('optimality_gap_%'), time.time(),
+             json.dumps(results, default=_to_builtin), options_hash, self.run_id, results.get('job_index'))
+        )
+        self._connection.commit()
+
+    def load_all(self, all_versions=False, options_hash=None, latest=True):
+        """
+        Résultats stockés pour la version courante du code (ordre de la suite,
+        colonne job_index),
+        d'une seule exécution : celle du jeu d'options options_hash (préfixe
+        accepté) s'il est donné, sinon la plus récente (voir start_run).
+        latest=False : toutes les lignes, exécutions et options confondues.
+        """
+        conditions = []
+        args = []
+        if not all_versions:
+            conditions.append('code_version = ?')
+            args.append(self.version)
+        if options_hash is not None:
+            conditions.append('options_hash LIKE ?')
+            args.append(options_hash + '%')
+        elif latest:
+            where = ' WHERE ' + ' AND '.join(conditions) if conditions else ''
+            run_id = self._connection.execute(f'SELECT MAX(run_id) FROM results{where}', args).fetchone()[0]
+            if run_id is not None:
+                conditions.append('run_id = ?')
+                args.append(run_id)
+        query = 'SELECT results FROM results'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        return [json.loads(row[0]) for row in self._connection.execute(query + ' ORDER BY job_index IS NULL, job_index, rowid', args)]
+
+    def close(self):
+        self._connection.close()
+
+
+def _to_builtin(obj):
+    """Conversion des types NumPy pour json.dump"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type non sérialisable : {type(obj).__name__}")
+
+
+def estimate_job_cost(instance, params):
+    """
+    Estimation grossière du coût d'un job, utilisée pour lancer les jobs
+    les plus longs en premier (n_tâches × n_serveurs × itérations).
+    """
+    return (instance['n_tasks'] * instance['n_servers']
+            * params.get('max_iterations', 1)
+            * params.get('max_generations', 1)
+            * params.get('population_size', 1))
+
+
+def _run_job(instance, algo_func, algo_name, params, time_budget=None, evaluation=None):
+    """
+    Exécute un couple (instance, algorithme) ; fonction de module pour le pool.
+    evaluation : options de evaluate_algorithm (mesure, progression, compteurs)
+    """
+    evaluation = dict(evaluation or {})
+    evaluation.setdefault('track_progress', True)
+    results, _ = evaluate_algorithm(
+        algo_func, instance['tasks'], instance['n_servers'], algo_name,
+        time_budget=time_budget, **evaluation, **params
+    )
+    
+    # Ajouter les informations de l'instance
+    if 'seed' in params:
+        results['seed'] = params['seed']
+    results['instance_id'] = instance['id']
+    results['n_tasks'] = instance['n_tasks']
+    results['n_servers'] = instance['n_servers']
+    results['description'] = instance['description']
+    return results
+
+
+def _print_job(results, algo_name):
+    if 'seed' in results:
+        algo_name = f"{algo_name} (graine {results['seed']})"
+    print(f"  ✓ {algo_name:25s} | Makespan: {results['makespan']:6.0f} | "
+          f"Temps: {results['execution_time']:7.4f}s | Gap: {results['optimality_gap_%']:5.2f}%")
+
+
+def _seeded_params(algo_func, params, n_seeds, seed):
+    """
+    Paramètres des exécutions d'un algorithme : une par graine (seed,
+    seed + 1, ...) s'il est stochastique (paramètre `seed`), une seule sinon
+    ou si la graine est fixée dans ses paramètres
+    """
+    if 'seed' in params or 'seed' not in inspect.signature(algo_func).parameters:
+        return [params]
+    return [dict(params, seed=seed + replicate) for replicate in range(n_seeds)]
+
+
+def run_complete_benchmark(benchmark_suite, algorithms, n_workers=1, checkpoint=None, time_budget=None,
+                           repeats=1, warmup=0, measure_memory=True, collect_counters=False,
+                           progress_options=DEFAULT_PROGRESS, n_seeds=1, seed=0):
     """
     Exécute tous les algorithmes sur tous les benchmarks
+
+    Args:
+        n_workers: Nombre de processus ; au-delà de 1, les jobs sont répartis
+            sur un pool, les plus longs en premier (voir estimate_job_cost)
+        checkpoint: JobCheckpoint ou ResultStore optionnel ; chaque job
+            terminé y est écrit et les jobs déjà présents sont sautés
+        time_budget: Budget de temps par job (secondes) pour comparer les
+            algorithmes à temps égal (voir evaluate_algorithm)
+        repeats, warmup, measure_memory: Protocole de mesure de chaque job
+            (exécutions chronométrées, d'échauffement, passe mémoire ;
+            voir evaluate_algorithm)
+        collect_counters: Instrumentation des solveurs (colonne 'counters')
+        progress_options: Décimation des courbes de progression (paramètres
+            de ProgressRecorder ; None pour garder tous les points)
+        n_seeds, seed: Chaque algorithme stochastique est exécuté avec les
+            graines seed, ..., seed + n_seeds - 1 (un job par graine, colonne
+            'seed') ; les algorithmes déterministes une seule fois
+
+    Les résultats sont toujours rendus dans l'ordre (instance, algorithme),
+    quel que soit l'ordre de terminaison des jobs ; la colonne job_index
+    garde cette position pour les rapports relus depuis checkpoint.
     """
-    all_results = []
+    evaluation = {'repeats': repeats, 'warmup': warmup, 'measure_memory': measure_memory,
+                  'collect_counters': collect_counters, 'track_progress': progress_options or True}
+    jobs = [
+        (instance, algo_func, algo_name, run_params, time_budget, evaluation)
+        for instance in benchmark_suite
+        for algo_func, algo_name, params in algorithms
+        for run_params in _seeded_params(algo_func, params, n_seeds, seed)
+    ]
+    options = dict(evaluation, time_budget=time_budget)
+    options_hash = job_digest({}, options)  # Jeu d'options de cette exécution (sélection du rapport)
+    job_results = [None] * len(jobs)
+    job_keys = [checkpoint.key(instance, algo_name, params, options)
+                if checkpoint else None
+                for instance, _, algo_name, params, _, _ in jobs]
     
     print("🚀 Démarrage du benchmarking complet...\n")
     
-    for idx, instance in enumerate(benchmark_suite, 1):
-        print(f"📊 Instance {idx}/{len(benchmark_suite)}: {instance['description']}")
-        print("-" * 70)
-        
-        tasks = instance['tasks']
-        n_servers = instance['n_servers']
-        
-        for algo_func, algo_name, params in algorithms:
-            try:
-                results, solution = evaluate_algorithm(
-                    algo_func, tasks, n_servers, algo_name, track_progress=True, **params
-                )
-                
-                # Ajouter les informations de l'instance
-                results['instance_id'] = instance['id']
-                results['n_tasks'] = instance['n_tasks']
-                results['n_servers'] = instance['n_servers']
-                results['description'] = instance['description']
-                
-                all_results.append(results)
-                
-                print(f"  ✓ {algo_name:25s} | Makespan: {results['makespan']:6.0f} | "
-                      f"Temps: {results['execution_time']:7.4f}s | Gap: {results['optimality_gap_%']:5.2f}%")
-                
-            except Exception as e:
-                print(f"  ✗ {algo_name:25s} | ERREUR: {str(e)}")
-        
+    if checkpoint:
+        checkpoint.start_run()
+    pending = []
+    for job_idx, key in enumerate(job_keys):
+        cached = checkpoint.load(key) if checkpoint else None
+        if cached is not None:
+            cached.setdefault('options_hash', options_hash)
+            if cached.get('job_index') != job_idx:
+                # Suite réordonnée ou résultat antérieur à job_index : position mise à jour
+                cached['job_index'] = job_idx
+                checkpoint.save(key, cached)
+            job_results[job_idx] = cached
+        else:
+            pending.append(job_idx)
+    if checkpoint and len(pending) < len(jobs):
+        print(f"↺ {len(jobs) - len(pending)}/{len(jobs)} jobs repris depuis '{checkpoint.location}'\n")
+    
+    def finish(job_idx, results):
+        results['options_hash'] = options_hash
+        results['job_index'] = job_idx  # Position dans la suite : ordre du rapport
+        job_results[job_idx] = results
+        if checkpoint:
+            checkpoint.save(job_keys[job_idx], results)
+    
+    if n_workers <= 1:
+        for idx, instance in enumerate(benchmark_suite, 1):
+            instance_jobs = [job_idx for job_idx in pending if jobs[job_idx][0] is instance]
+            if not instance_jobs:
+                continue
+            print(f"📊 Instance {idx}/{len(benchmark_suite)}: {instance['description']}")
+            print("-" * 70)
+            for job_idx in instance_jobs:
+                algo_name = jobs[job_idx][2]
+                try:
+                    results = _run_job(*jobs[job_idx])
+                    finish(job_idx, results)
+                    _print_job(results, algo_name)
+                except Exception as e:
+                    print(f"  ✗ {algo_name:25s} | ERREUR: {str(e)}")
+            print()
+    else:
+        # Les jobs les plus longs d'abord pour équilibrer le pool
+        pending.sort(key=lambda job_idx: estimate_job_cost(jobs[job_idx][0], jobs[job_idx][3]), reverse=True)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(_run_job, *jobs[job_idx]): job_idx for job_idx in pending}
+            for n_done, future in enumerate(as_completed(futures), 1):
+                job_idx = futures[future]
+                instance, _, algo_name, _, _, _ = jobs[job_idx]
+                print(f"[{n_done}/{len(pending)}] {instance['description']}")
+                try:
+                    results = future.result()
+                    finish(job_idx, results)
+                    _print_job(results, algo_name)
+                except Exception as e:
+                    print(f"  ✗ {algo_name:25s} | ERREUR: {str(e)}")
         print()
     
-    return pd.DataFrame(all_results)
+    return pd.DataFrame([results for results in job_results if results is not None])
+
+def add_exact_gaps(df):
+    """
+    Ajoute l'optimum des instances résolues exactement ('optimum') et
+    l'écart de chaque algorithme à cet optimum ('gap_to_optimum_%').
+    Les instances sans optimum prouvé restent à NaN.
+    """
+    if 'proven_optimal' not in df.columns:
+        return df
+    proven = df[df['proven_optimal'] == True]
+    optima = proven.groupby('instance_id')['makespan'].min()
+    df['optimum'] = df['instance_id'].map(optima)
+    df['gap_to_optimum_%'] = ((df['makespan'] - df['optimum']) / df['optimum'] * 100).round(2)
+    return df
+
+def _progress_columns(progress):
+    """
+    Colonnes de progression d'un résultat (voir ProgressRecorder) ; les
+    anciens résultats sauvegardés en liste de dicts sont convertis.
+    """
+    if isinstance(progress, dict):
+        return {name: np.asarray(values) for name, values in progress.items()}
+    if isinstance(progress, list) and progress:
+        return {name: np.array([point.get(name, np.nan) for point in progress])
+                for name in ProgressRecorder.COLUMNS}
+    return None
+
+
+ALGO_COLORS = {
+    'Algorithme Glouton': '#3498db',
+    'Recherche Tabou': '#e74c3c',
+    'Algorithme Génétique': '#2ecc71',
+    'Branch and Bound (exact)': '#9b59b6'
+}
+
+
+def evolution_figures(df, max_points=MAX_PLOT_POINTS):
+    """
+    Figures d'évolution par instance (voir render_figures) ; les courbes de
+    progression sont réduites à max_points points avant le tracé.
+    """
+    figures = []
+    for inst_id in df['instance_id'].unique():
+        inst_df = df[df['instance_id'] == inst_id]
+        series = []
+        for _, row in inst_df.iterrows():
+            curve = {'algorithm': row['algorithm'], 'makespan': row['makespan'],
+                     'execution_time': row['execution_time']}
+            progress = _progress_columns(row.get('progress', None))
+            if progress is not None and len(progress['step']) > 0:
+                progress = downsample_progress(progress, max_points)
+                curve.update(step=progress['step'], best_makespan=progress['best_makespan'],
+                             elapsed_time=progress['elapsed_time'])
+            series.append(curve)
+        figures.append((_render_evolution, f"evolution_{inst_id}.png",
+                        {'description': inst_df.iloc[0]['description'], 'series': series}))
+    return figures
 
-def create_evolution_plots(df):
-    """Crée des graphiques d'évolution par instance:
+
+def _render_evolution(out_path, data):
+    """Graphique d'évolution d'une instance:
     - Makespan vs itération/génération (fonction coût)
     - Makespan vs temps (performance)
     """
-    instances = df['instance_id'].unique()
-    algo_colors = {
-        'Algorithme Glouton': '#3498db',
-        'Recherche Tabou': '#e74c3c',
-        'Algorithme Génétique': '#2ecc71'
-    }
+    plt = pyplot()
+    description = data['description']
 
-    for inst_id in instances:
-        inst_df = df[df['instance_id'] == inst_id]
-        description = inst_df.iloc[0]['description']
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+    for curve in data['series']:
+        algo = curve['algorithm']
+        color = ALGO_COLORS.get(algo, None)
 
-        for _, row in inst_df.iterrows():
-            algo = row['algorithm']
-            color = algo_colors.get(algo, None)
-            progress = row.get('progress', None)
-
-            # Courbe en fonction des étapes
-            if isinstance(progress, list) and len(progress) > 0:
-                steps = [p['step'] for p in progress if 'step' in p]
-                best_mk = [p.get('best_makespan', p.get('current_makespan')) for p in progress]
-                ax1.plot(steps, best_mk, label=algo, linewidth=2, marker='o', alpha=0.9, color=color)
-            else:
-                # Un seul point (Greedy sans progression)
-                ax1.scatter([1], [row['makespan']], label=algo, s=60, color=color)
-
-            # Courbe en fonction du temps
-            if isinstance(progress, list):
-                time_points = [p['elapsed_time'] for p in progress if p.get('elapsed_time') is not None]
-                if time_points:
-                    mk_time = [p.get('best_makespan', p.get('current_makespan')) for p in progress if p.get('elapsed_time') is not None]
-                    ax2.plot(time_points, mk_time, label=f"{algo}", linewidth=2, marker='o', alpha=0.9, color=color)
-                else:
-                    # Pas de temps par étape, placer point final
-                    ax2.scatter([row['execution_time']], [row['makespan']], label=f"{algo}", s=60, color=color)
-            else:
-                ax2.scatter([row['execution_time']], [row['makespan']], label=f"{algo}", s=60, color=color)
-
-        ax1.set_title(f"Évolution par itération\n{description}", fontsize=12, fontweight='bold')
-        ax1.set_xlabel('Étape (itération / génération)')
-        ax1.set_ylabel('Makespan (fonction coût)')
-        ax1.grid(True, alpha=0.3)
-        ax1.legend(fontsize=9)
-
-        ax2.set_title(f"Évolution dans le temps\n{description}", fontsize=12, fontweight='bold')
-        ax2.set_xlabel('Temps écoulé (s)')
-        ax2.set_ylabel('Makespan (fonction coût)')
-        ax2.grid(True, alpha=0.3)
-        ax2.legend(fontsize=9)
-
-        plt.tight_layout()
-        out_path = f"evolution_{inst_id}.png"
-        plt.savefig(out_path, dpi=300, bbox_inches='tight')
-        print(f"✅ Graphique d'évolution sauvegardé: {out_path}")
-        plt.close(fig)
+        # Courbe en fonction des étapes
+        if 'step' in curve:
+            ax1.plot(curve['step'], curve['best_makespan'], label=algo, linewidth=2, marker='o',
+                     alpha=0.9, color=color)
+            ax2.plot(curve['elapsed_time'], curve['best_makespan'], label=f"{algo}", linewidth=2,
+                     marker='o', alpha=0.9, color=color)
+        else:
+            # Un seul point (pas de progression) : étape 1 et temps final
+            ax1.scatter([1], [curve['makespan']], label=algo, s=60, color=color)
+            ax2.scatter([curve['execution_time']], [curve['makespan']], label=f"{algo}", s=60, color=color)
+
+    ax1.set_title(f"Évolution par itération\n{description}", fontsize=12, fontweight='bold')
+    ax1.set_xlabel('Étape (itération / génération)')
+    ax1.set_ylabel('Makespan (fonction coût)')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend(fontsize=9)
+
+    ax2.set_title(f"Évolution dans le temps\n{description}", fontsize=12, fontweight='bold')
+    ax2.set_xlabel('Temps écoulé (s)')
+    ax2.set_ylabel('Makespan (fonction coût)')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend(fontsize=9)
+
+    plt.tight_layout()
+    plt.savefig(out_path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def create_evolution_plots(df, n_workers=None):
+    """Crée les graphiques d'évolution par instance (evolution_<id>.png)"""
+    return render_figures(evolution_figures(df), n_workers)
 
 def create_comparison_tables(df):
     """Crée des tableaux de comparaison"""
@@ -155,12 +549,51 @@ def create_comparison_tables(df):
     )
     print(pivot_gap.to_string())
     
+    if 'gap_to_optimum_%' in df.columns and df['gap_to_optimum_%'].notna().any():
+        print("\n" + "=" * 100)
+        print("🎯 TABLEAU RÉCAPITULATIF - ÉCART À L'OPTIMUM PROUVÉ (%)")
+        print("=" * 100)
+        print(df.pivot(index='description', columns='algorithm', values='gap_to_optimum_%').to_string())
+    
     return pivot_makespan, pivot_time, pivot_gap
 
-def create_visualizations(df):
-    """Crée des visualisations complètes"""
+COMPARISON_METRICS = ['makespan', 'execution_time', 'optimality_gap_%', 'load_variance']
+
+
+def comparison_figure(df):
+    """Figure de comparaison des algorithmes (benchmarking_results.png, voir render_figures)"""
+    algorithms = list(df['algorithm'].unique())
+    
+    # Normaliser les métriques pour comparaison
+    metrics_normalized = df.groupby('algorithm').agg({metric: 'mean' for metric in COMPARISON_METRICS})
     
-    algorithms = df['algorithm'].unique()
+    # Normaliser entre 0 et 1 (inverser pour makespan et temps car plus bas = mieux)
+    for col in metrics_normalized.columns:
+        metrics_normalized[col] = (metrics_normalized[col] - metrics_normalized[col].min()) / (metrics_normalized[col].max() - metrics_normalized[col].min())
+    
+    data = {
+        'algorithms': algorithms,
+        'instances': list(df['instance_id'].unique()),
+        'metrics': {algo: {metric: df.loc[df['algorithm'] == algo, metric].tolist()
+                           for metric in COMPARISON_METRICS + ['instance_id']}
+                    for algo in algorithms},
+        'boxplot': {'algorithm': df['algorithm'].tolist(), 'makespan': df['makespan'].tolist()},
+        'heatmap': metrics_normalized.T.to_dict(orient='split'),
+    }
+    return _render_comparison, 'benchmarking_results.png', data
+
+
+def _render_comparison(out_path, data):
+    """Visualisations complètes"""
+    plt = pyplot()
+    import seaborn as sns
+    
+    algorithms = data['algorithms']
+    metrics = data['metrics']
+    # Abscisse : position de l'instance dans la suite, commune à tous les algorithmes
+    instances = data['instances']
+    positions = {algo: [instances.index(instance_id) for instance_id in metrics[algo]['instance_id']]
+                 for algo in algorithms}
     colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
     
     fig = plt.figure(figsize=(18, 12))
@@ -168,10 +601,10 @@ def create_visualizations(df):
     # 1. Makespan par instance
     ax1 = plt.subplot(2, 3, 1)
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['algorithm'] == algo]
-        ax1.plot(range(len(algo_data)), algo_data['makespan'].values, 
+        ax1.plot(positions[algo], metrics[algo]['makespan'], 
                 marker='o', label=algo, linewidth=2, color=colors[i])
     ax1.set_xlabel('Instance', fontsize=11)
+    ax1.set_xticks(range(len(instances)), instances, rotation=45, ha='right', fontsize=8)
     ax1.set_ylabel('Makespan (Charge Max)', fontsize=11)
     ax1.set_title('Comparaison du Makespan', fontsize=12, fontweight='bold')
     ax1.legend(fontsize=9)
@@ -180,10 +613,10 @@ def create_visualizations(df):
     # 2. Temps d'exécution
     ax2 = plt.subplot(2, 3, 2)
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['algorithm'] == algo]
-        ax2.plot(range(len(algo_data)), algo_data['execution_time'].values, 
+        ax2.plot(positions[algo], metrics[algo]['execution_time'], 
                 marker='s', label=algo, linewidth=2, color=colors[i])
     ax2.set_xlabel('Instance', fontsize=11)
+    ax2.set_xticks(range(len(instances)), instances, rotation=45, ha='right', fontsize=8)
     ax2.set_ylabel('Temps (secondes)', fontsize=11)
     ax2.set_title('Temps d\'Exécution', fontsize=12, fontweight='bold')
     ax2.legend(fontsize=9)
@@ -193,10 +626,10 @@ def create_visualizations(df):
     # 3. Gap d'optimalité
     ax3 = plt.subplot(2, 3, 3)
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['algorithm'] == algo]
-        ax3.plot(range(len(algo_data)), algo_data['optimality_gap_%'].values, 
+        ax3.plot(positions[algo], metrics[algo]['optimality_gap_%'], 
                 marker='^', label=algo, linewidth=2, color=colors[i])
     ax3.set_xlabel('Instance', fontsize=11)
+    ax3.set_xticks(range(len(instances)), instances, rotation=45, ha='right', fontsize=8)
     ax3.set_ylabel('Gap d\'Optimalité (%)', fontsize=11)
     ax3.set_title('Qualité de la Solution', fontsize=12, fontweight='bold')
     ax3.legend(fontsize=9)
@@ -204,7 +637,7 @@ def create_visualizations(df):
     
     # 4. Boxplot - Makespan
     ax4 = plt.subplot(2, 3, 4)
-    df.boxplot(column='makespan', by='algorithm', ax=ax4)
+    pd.DataFrame(data['boxplot']).boxplot(column='makespan', by='algorithm', ax=ax4)
     ax4.set_xlabel('Algorithme', fontsize=11)
     ax4.set_ylabel('Makespan', fontsize=11)
     ax4.set_title('Distribution du Makespan', fontsize=12, fontweight='bold')
@@ -214,10 +647,10 @@ def create_visualizations(df):
     # 5. Variance des charges
     ax5 = plt.subplot(2, 3, 5)
     for i, algo in enumerate(algorithms):
-        algo_data = df[df['algorithm'] == algo]
-        ax5.plot(range(len(algo_data)), algo_data['load_variance'].values, 
+        ax5.plot(positions[algo], metrics[algo]['load_variance'], 
                 marker='d', label=algo, linewidth=2, color=colors[i])
     ax5.set_xlabel('Instance', fontsize=11)
+    ax5.set_xticks(range(len(instances)), instances, rotation=45, ha='right', fontsize=8)
     ax5.set_ylabel('Variance des Charges', fontsize=11)
     ax5.set_title('Équilibrage de la Charge', fontsize=12, fontweight='bold')
     ax5.legend(fontsize=9)
@@ -225,20 +658,7 @@ def create_visualizations(df):
     
     # 6. Heatmap - Performance globale
     ax6 = plt.subplot(2, 3, 6)
-    
-    # Normaliser les métriques pour comparaison
-    metrics_normalized = df.groupby('algorithm').agg({
-        'makespan': 'mean',
-        'execution_time': 'mean',
-        'optimality_gap_%': 'mean',
-        'load_variance': 'mean'
-    })
-    
-    # Normaliser entre 0 et 1 (inverser pour makespan et temps car plus bas = mieux)
-    for col in metrics_normalized.columns:
-        metrics_normalized[col] = (metrics_normalized[col] - metrics_normalized[col].min()) / (metrics_normalized[col].max() - metrics_normalized[col].min())
-    
-    sns.heatmap(metrics_normalized.T, annot=True, fmt='.3f', cmap='RdYlGn_r', 
+    sns.heatmap(pd.DataFrame(**data['heatmap']), annot=True, fmt='.3f', cmap='RdYlGn_r', 
                 cbar_kws={'label': 'Score Normalisé'}, ax=ax6, linewidths=0.5)
     ax6.set_xlabel('Algorithme', fontsize=11)
     ax6.set_ylabel('Métrique', fontsize=11)
@@ -247,9 +667,13 @@ def create_visualizations(df):
     plt.xticks(rotation=15, ha='right', fontsize=9)
     
     plt.tight_layout()
-    plt.savefig('benchmarking_results.png', dpi=300, bbox_inches='tight')
-    print("\n✅ Graphiques sauvegardés dans 'benchmarking_results.png'")
-    plt.show()
+    plt.savefig(out_path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def create_visualizations(df):
+    """Crée des visualisations complètes (benchmarking_results.png)"""
+    return render_figures([comparison_figure(df)])
 
 def compute_statistics(df):
     """Calcule des statistiques détaillées"""
@@ -287,12 +711,22 @@ def compute_statistics(df):
     rank_summary['rank_moyen_global'] = rank_summary.mean(axis=1).round(2)
     rank_summary = rank_summary.sort_values('rank_moyen_global')
     
+    # Tests de Wilcoxon appariés par instance face au premier du classement
+    best = rank_summary.index[0]
+    makespan_tests = paired_tests(df, 'makespan', reference=best)
+    time_tests = paired_tests(df, 'execution_time', reference=best)
+    rank_summary['p_makespan_vs_best'] = makespan_tests['p_value'].round(4)
+    rank_summary['p_time_vs_best'] = time_tests['p_value'].round(4)
+    
     print(rank_summary.to_string())
     
+    print(f"\n🧪 Tests de Wilcoxon appariés par instance face à '{best}' (makespan, p < 0.05 : significatif)")
+    print(makespan_tests.drop(columns=['reference']).to_string())
+    
     return stats, rank_summary
 
-def analyze_complexity(df):
-    """Analyse de la complexité par rapport à la taille"""
+def analyze_complexity(df, plot=True):
+    """Analyse de la complexité par rapport à la taille (plot : complexity_analysis.png)"""
     
     print("\n" + "=" * 100)
     print("🔬 ANALYSE DE COMPLEXITÉ")
@@ -307,14 +741,37 @@ def analyze_complexity(df):
     print("\nTemps moyen par taille d'instance:")
     print(complexity_analysis.pivot(index='n_tasks', columns='algorithm', values='execution_time').to_string())
     
-    # Graphique complexité
+    if plot:
+        render_figures([complexity_figure(df)])
+
+
+def complexity_figure(df):
+    """Figure de scalabilité et d'efficacité (complexity_analysis.png, voir render_figures)"""
+    complexity_analysis = df.groupby(['algorithm', 'n_tasks']).agg({'execution_time': 'mean'}).reset_index()
+    algorithms = list(df['algorithm'].unique())
+    data = {'algorithms': algorithms, 'scaling': {}, 'efficiency': {}}
+    for algo in algorithms:
+        algo_data = complexity_analysis[complexity_analysis['algorithm'] == algo]
+        data['scaling'][algo] = {'n_tasks': algo_data['n_tasks'].tolist(),
+                                 'execution_time': algo_data['execution_time'].tolist()}
+        # Efficacité (qualité / temps)
+        algo_df = df[df['algorithm'] == algo]
+        efficiency = (100 - algo_df['optimality_gap_%']) / (algo_df['execution_time'] + 0.0001)
+        data['efficiency'][algo] = {'n_tasks': algo_df['n_tasks'].tolist(), 'efficiency': efficiency.tolist()}
+    return _render_complexity, 'complexity_analysis.png', data
+
+
+def _render_complexity(out_path, data):
+    """Graphique complexité"""
+    plt = pyplot()
+
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
     
-    algorithms = df['algorithm'].unique()
+    algorithms = data['algorithms']
     colors = ['#3498db', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6']
     
     for i, algo in enumerate(algorithms):
-        algo_data = complexity_analysis[complexity_analysis['algorithm'] == algo]
+        algo_data = data['scaling'][algo]
         ax1.plot(algo_data['n_tasks'], algo_data['execution_time'], 
                 marker='o', label=algo, linewidth=2, color=colors[i])
     
@@ -328,9 +785,8 @@ def analyze_complexity(df):
     
     # Efficacité (qualité / temps)
     for i, algo in enumerate(algorithms):
-        algo_df = df[df['algorithm'] == algo]
-        efficiency = (100 - algo_df['optimality_gap_%']) / (algo_df['execution_time'] + 0.0001)
-        ax2.scatter(algo_df['n_tasks'], efficiency, 
+        algo_data = data['efficiency'][algo]
+        ax2.scatter(algo_data['n_tasks'], algo_data['efficiency'], 
                    label=algo, alpha=0.6, s=100, color=colors[i])
     
     ax2.set_xlabel('Nombre de Tâches', fontsize=12)
@@ -341,9 +797,8 @@ def analyze_complexity(df):
     ax2.set_xscale('log')
     
     plt.tight_layout()
-    plt.savefig('complexity_analysis.png', dpi=300, bbox_inches='tight')
-    print("\n✅ Graphiques de complexité sauvegardés dans 'complexity_analysis.png'")
-    plt.show()
+    plt.savefig(out_path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
 
 def generate_conclusions(rank_summary, df):
     """Génère des conclusions automatiques"""
@@ -378,15 +833,75 @@ def generate_conclusions(rank_summary, df):
     print("   • Pour qualité optimale: Algorithme Génétique ou Recherche Tabou")
     print("   • Pour production temps réel: Algorithme Glouton")
 
-def save_results_to_excel(df, pivot_makespan, pivot_time, pivot_gap, rank_summary):
+def print_run_summary(df):
+    """
+    Moyenne et médiane sur les graines, avec IC bootstrap à 95 %, du makespan
+    et du temps de chaque couple (instance, algorithme) exécuté plusieurs fois
+    """
+    summary = summarize_runs(df)
+    
+    print("\n" + "=" * 100)
+    print("🎲 STATISTIQUES SUR LES GRAINES (intervalles de confiance bootstrap à 95 %)")
+    print("=" * 100)
+    
+    def interval(row, name, digits):
+        return (f"{row[name]:.{digits}f} [{row[name + '_ci_low']:.{digits}f}, "
+                f"{row[name + '_ci_high']:.{digits}f}]")
+    
+    table = pd.DataFrame({
+        'instance_id': summary['instance_id'],
+        'algorithm': summary['algorithm'],
+        'n': summary['n_runs'],
+        'makespan moyen': summary.apply(interval, axis=1, args=('makespan_mean', 1)),
+        'makespan médian': summary.apply(interval, axis=1, args=('makespan_median', 1)),
+        'temps moyen (s)': summary.apply(interval, axis=1, args=('execution_time_mean', 4)),
+        'temps médian (s)': summary.apply(interval, axis=1, args=('execution_time_median', 4)),
+    })
+    print(table[table['n'] > 1].to_string(index=False))
+    return summary
+
+
+def print_fitness_cache_summary(df):
+    """
+    Succès, échecs et évictions du cache de fitness du GA (colonne
+    'fitness_cache', voir fitness_cache_size) par instance, cumulés sur les
+    graines, avec la taille de l'instance. None si aucun job n'a de cache.
+    """
+    if 'fitness_cache' not in df.columns:
+        return None
+    cached = df[df['fitness_cache'].apply(lambda stats: isinstance(stats, dict))]
+    if cached.empty:
+        return None
+    counters = pd.DataFrame(cached['fitness_cache'].tolist(), index=cached.index)[['hits', 'misses', 'evictions']]
+    rows = pd.concat([cached[['instance_id', 'algorithm', 'n_tasks', 'n_servers']], counters], axis=1)
+    summary = rows.groupby(['instance_id', 'algorithm'], sort=False).agg(
+        n_tasks=('n_tasks', 'first'), n_servers=('n_servers', 'first'),
+        hits=('hits', 'sum'), misses=('misses', 'sum'), evictions=('evictions', 'sum'))
+    lookups = summary['hits'] + summary['misses']
+    summary['hit_rate_%'] = (100 * summary['hits'] / lookups.where(lookups > 0)).round(1)
+    summary = summary.reset_index()
+    
+    print("\n" + "=" * 100)
+    print("🗃️  CACHE DE FITNESS DU GA (succès / échecs par instance)")
+    print("=" * 100)
+    print(summary.to_string(index=False))
+    return summary
+
+def save_results_to_excel(df, pivot_makespan, pivot_time, pivot_gap, rank_summary, run_summary=None,
+                          cache_summary=None):
     """Sauvegarde tous les résultats dans un fichier Excel"""
     
     with pd.ExcelWriter('benchmarking_results.xlsx', engine='openpyxl') as writer:
-        df.to_excel(writer, sheet_name='Résultats Complets', index=False)
+        # Les courbes de progression restent hors du classeur (colonnes potentiellement énormes)
+        df.drop(columns=['progress'], errors='ignore').to_excel(writer, sheet_name='Résultats Complets', index=False)
         pivot_makespan.to_excel(writer, sheet_name='Makespan')
         pivot_time.to_excel(writer, sheet_name='Temps Exécution')
         pivot_gap.to_excel(writer, sheet_name='Gap Optimalité')
         rank_summary.to_excel(writer, sheet_name='Classements')
+        if run_summary is not None:
+            run_summary.to_excel(writer, sheet_name='Graines', index=False)
+        if cache_summary is not None:
+            cache_summary.to_excel(writer, sheet_name='Cache Fitness', index=False)
     
     print("\n✅ Résultats sauvegardés dans 'benchmarking_results.xlsx'")
 
@@ -394,32 +909,45 @@ def save_results_to_excel(df, pivot_makespan, pivot_time, pivot_gap, rank_summar
 # SCRIPT PRINCIPAL
 # ============================================
 
-if __name__ == "__main__":
-    
-    print("=" * 100)
-    print(" " * 30 + "BENCHMARKING LOAD BALANCING")
-    print("=" * 100)
-    
-    # Charger le benchmark
-    try:
-        benchmark_suite = load_benchmark_data()
-        print(f"\n✅ {len(benchmark_suite)} instances chargées depuis 'load_balancing_benchmark.json'")
-    except FileNotFoundError:
-        print("\n⚠️  Fichier benchmark non trouvé. Génération d'un nouveau benchmark...")
-        from generate_benchmark import generate_benchmark_suite
-        benchmark_suite = generate_benchmark_suite()
-    
-    # Définir les algorithmes à tester
-    algorithms = [
+def default_algorithms(fitness_cache_size=0):
+    """
+    Algorithmes comparés et leurs paramètres : (fonction, nom, paramètres).
+    fitness_cache_size > 0 active le cache de fitness du GA (paramètre omis
+    sinon : les résultats déjà stockés gardent leur clé).
+    """
+    genetic_params = {'population_size': 50, 'max_generations': 100, 'mutation_rate': 0.1}
+    if fitness_cache_size:
+        genetic_params['fitness_cache_size'] = fitness_cache_size
+    return [
         (greedy_load_balancing, "Algorithme Glouton", {}),
         (tabu_search_load_balancing, "Recherche Tabou", 
          {'max_iterations': 100, 'tabu_tenure': 10}),
-        (genetic_algorithm_load_balancing, "Algorithme Génétique", 
-         {'population_size': 50, 'max_generations': 100, 'mutation_rate': 0.1})
+        (genetic_algorithm_load_balancing, "Algorithme Génétique", genetic_params),
+        (branch_and_bound_load_balancing, "Branch and Bound (exact)",
+         {'node_limit': 1_000_000, 'time_limit': 30})
     ]
+
+
+def report_results(results_df, excel=False, plot_workers=None):
+    """
+    Tableaux, statistiques, graphiques, conclusions et (option) export Excel.
+    plot_workers : processus de rendu des graphiques (défaut : un par cœur)
+    """
+    # Ordre de la suite (instance, algorithme, graine), pas celui de terminaison des jobs
+    results_df = sort_results(results_df)
     
-    # Exécuter le benchmarking
-    results_df = run_complete_benchmark(benchmark_suite, algorithms)
+    # Plusieurs graines : intervalles de confiance, puis médiane par (instance, algorithme)
+    run_summary = None
+    if has_repeated_runs(results_df):
+        run_summary = print_run_summary(results_df)
+    
+    # Cache de fitness du GA, cumulé sur les graines avant l'agrégation
+    cache_summary = print_fitness_cache_summary(results_df)
+    if run_summary is not None:
+        results_df = aggregate_runs(results_df)
+    
+    # Écart à l'optimum prouvé par le solveur exact
+    results_df = add_exact_gaps(results_df)
     
     # Créer les tableaux de comparaison
     pivot_makespan, pivot_time, pivot_gap = create_comparison_tables(results_df)
@@ -427,19 +955,22 @@ if __name__ == "__main__":
     # Calculer les statistiques
     stats, rank_summary = compute_statistics(results_df)
     
-    # Créer les visualisations
-    create_visualizations(results_df)
-    # Créer les courbes d'évolution par instance
-    create_evolution_plots(results_df)
-    
     # Analyser la complexité
-    analyze_complexity(results_df)
+    analyze_complexity(results_df, plot=False)
+    
+    # Graphiques : comparaison, complexité et évolution par instance, rendus
+    # ensemble dans un pool ; ceux dont les données n'ont pas changé sont sautés
+    print()
+    render_figures([comparison_figure(results_df), complexity_figure(results_df)]
+                   + evolution_figures(results_df), n_workers=plot_workers)
     
     # Générer les conclusions
     generate_conclusions(rank_summary, results_df)
     
-    # Sauvegarder dans Excel
-    save_results_to_excel(results_df, pivot_makespan, pivot_time, pivot_gap, rank_summary)
+    # Sauvegarder dans Excel (étape optionnelle : les résultats sont déjà dans le ResultStore)
+    if excel:
+        save_results_to_excel(results_df, pivot_makespan, pivot_time, pivot_gap, rank_summary, run_summary,
+                              cache_summary)
     
     print("\n" + "=" * 100)
     print("✅ BENCHMARKING TERMINÉ AVEC SUCCÈS!")
@@ -447,5 +978,54 @@ if __name__ == "__main__":
     print("\n📁 Fichiers générés:")
     print("   • benchmarking_results.png - Visualisations comparatives")
     print("   • complexity_analysis.png - Analyse de scalabilité")
-    print("   • benchmarking_results.xlsx - Résultats complets")
-    print("\n" + "=" * 100)
\ No newline at end of file
+    if excel:
+        print("   • benchmarking_results.xlsx - Résultats complets")
+    print("\n" + "=" * 100)
+    return results_df
+
+
+def run_benchmark(suite_path='load_balancing_benchmark.json', n_workers=1, checkpoint_dir=None, time_budget=None,
+                  repeats=1, warmup=0, measure_memory=True, collect_counters=False,
+                  progress_options=DEFAULT_PROGRESS, store_path='benchmark_results.sqlite', excel=False,
+                  n_seeds=1, seed=0, fitness_cache_size=0):
+    """
+    Charge la suite, exécute tous les algorithmes puis produit le rapport.
+    Les résultats sont lus et écrits dans le ResultStore store_path (None
+    pour tout recalculer), ou dans un JobCheckpoint si checkpoint_dir est donné.
+    n_seeds > 1 : algorithmes stochastiques exécutés sur plusieurs graines,
+    rapport avec intervalles de confiance (voir run_complete_benchmark).
+    fitness_cache_size : cache de fitness du GA (voir default_algorithms).
+    """
+    print("=" * 100)
+    print(" " * 30 + "BENCHMARKING LOAD BALANCING")
+    print("=" * 100)
+    
+    # Charger le benchmark
+    try:
+        benchmark_suite = load_benchmark_data(suite_path)
+        print(f"\n✅ {len(benchmark_suite)} instances chargées depuis '{suite_path}'")
+    except FileNotFoundError:
+        print("\n⚠️  Fichier benchmark non trouvé. Génération d'un nouveau benchmark...")
+        from generate_benchmark import generate_benchmark_suite
+        benchmark_suite = generate_benchmark_suite()
+    
+    # Exécuter le benchmarking
+    if checkpoint_dir:
+        checkpoint = JobCheckpoint(checkpoint_dir)
+    elif store_path:
+        checkpoint = ResultStore(store_path)
+    else:
+        checkpoint = None
+    results_df = run_complete_benchmark(benchmark_suite, default_algorithms(fitness_cache_size), n_workers=n_workers,
+                                        checkpoint=checkpoint, time_budget=time_budget,
+                                        repeats=repeats, warmup=warmup, measure_memory=measure_memory,
+                                        collect_counters=collect_counters, progress_options=progress_options,
+                                        n_seeds=n_seeds, seed=seed)
+    return report_results(results_df, excel=excel)
+
+
+if __name__ == "__main__":
+    # Mêmes options que `python cli.py bench`
+    import sys
+    from cli import main
+    main(['bench'] + sys.argv[1:])
@@ -0,0 +1,62 @@
+import numpy as np
+
+
+# ============================================
+# BORNES INFÉRIEURES DU MAKESPAN
+# ============================================
+
+def _is_integral(durations):
+    """Vrai si toutes les durées sont entières (le makespan l'est alors aussi)"""
+    if np.issubdtype(durations.dtype, np.integer):
+        return True
+    return bool(np.all(np.floor(durations) == durations))
+
+
+def average_bound(tasks, n_servers):
+    """
+    Charge moyenne : sum(tasks) / n_servers, arrondie au supérieur quand les
+    durées sont entières.
+    """
+    durations = np.asarray(tasks)
+    bound = durations.sum().item() / n_servers
+    if _is_integral(durations):
+        bound = float(np.ceil(bound))
+    return bound
+
+
+def max_task_bound(tasks):
+    """La plus longue tâche doit être exécutée entièrement sur un serveur"""
+    durations = np.asarray(tasks)
+    return durations.max().item() if len(durations) else 0
+
+
+def pigeonhole_bound(tasks, n_servers):
+    """
+    Bornes par tiroirs : parmi les k·m+1 plus longues tâches, un serveur en
+    reçoit au moins k+1, donc au moins les k+1 plus courtes d'entre elles.
+    Pour k = 1 : p_m + p_(m+1) (m-ième et (m+1)-ième plus longues).
+    Retourne le maximum sur tous les k tels que k·m < n.
+    """
+    durations = np.sort(np.asarray(tasks))[::-1]
+    n_tasks = len(durations)
+    k = np.arange(1, (n_tasks - 1) // n_servers + 1) if n_servers > 0 else np.arange(0)
+    if len(k) == 0:
+        return 0
+    cumulative = np.concatenate([[0], np.cumsum(durations)])
+    # Somme de durations[k·m - k : k·m + 1]
+    bounds = cumulative[k * n_servers + 1] - cumulative[k * n_servers - k]
+    return bounds.max().item()
+
+
+def lower_bounds(tasks, n_servers):
+    """Toutes les bornes inférieures, par nom"""
+    return {
+        'average': average_bound(tasks, n_servers),
+        'max_task': max_task_bound(tasks),
+        'pigeonhole': pigeonhole_bound(tasks, n_servers),
+    }
+
+
+def best_lower_bound(tasks, n_servers):
+    """Meilleure (plus grande) borne inférieure du makespan"""
+    return max(lower_bounds(tasks, n_servers).values())
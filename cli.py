@@ -0,0 +1,312 @@
+"""
+Interface en ligne de commande du projet Load Balancing.
+
+    python cli.py generate [--large ...]      Génère une suite d'instances
+    python cli.py solve --tasks 10 20 30 -m 2 Résout une instance
+    python cli.py bench [--workers N ...]     Benchmark complet + rapport
+    python cli.py report [--store F]          Rapport depuis des résultats sauvegardés
+    python cli.py gate [--update]             Comparaison à la baseline de performance
+    python cli.py sweep [--time-cap S]        Passage à l'échelle et exposants empiriques
+
+Les dépendances lourdes (pandas, matplotlib, seaborn) ne sont importées
+que par les sous-commandes qui en ont besoin : `solve` ne charge que NumPy.
+"""
+import argparse
+import ast
+import inspect
+import sys
+import time
+
+
+ALGORITHMS = {
+    'greedy': 'greedy_load_balancing',
+    'tabu': 'tabu_search_load_balancing',
+    'genetic': 'genetic_algorithm_load_balancing',
+    'bnb': 'branch_and_bound_load_balancing',
+}
+
+
+def _parse_params(pairs):
+    """['max_iterations=200', 'seed=1'] -> {'max_iterations': 200, 'seed': 1}"""
+    params = {}
+    for pair in pairs:
+        name, sep, value = pair.partition('=')
+        if not sep:
+            raise SystemExit(f"Paramètre invalide : {pair!r} (attendu : nom=valeur)")
+        try:
+            params[name] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            params[name] = value
+    return params
+
+
+def add_progress_arguments(parser):
+    """Options de décimation des courbes de progression (voir ProgressRecorder)"""
+    parser.add_argument('--progress-points', type=int, default=2000,
+                        help="Points de progression max par job (0 : tous, défaut : 2000)")
+    parser.add_argument('--progress-log', type=int, default=None, metavar='K',
+                        help="Points de progression espacés logarithmiquement (K par décade)")
+    parser.add_argument('--progress-improvements', action='store_true',
+                        help="Ne garder que les points où le meilleur makespan s'améliore")
+
+
+def progress_options(args):
+    """Paramètres de ProgressRecorder tirés des options (None : tous les points)"""
+    options = {}
+    if args.progress_points:
+        options['max_points'] = args.progress_points
+    if args.progress_log:
+        options['log_points'] = args.progress_log
+    if args.progress_improvements:
+        options['improvement_only'] = True
+    return options or None
+
+
+# ============================================
+# SOUS-COMMANDES
+# ============================================
+
+def cmd_generate(args):
+    if args.large:
+        from large_scale_generator import generate_large_scale_suite, large_scale_configurations
+        manifest = generate_large_scale_suite(
+            args.output_dir, large_scale_configurations(args.sizes, args.distributions), seed=args.seed
+        )
+        print(f"\n✅ {len(manifest['instances'])} instances écrites dans '{args.output_dir}'")
+    else:
+        from generate_benchmark import main as generate_main
+        generate_main(visualize=args.plot)
+
+
+def cmd_solve(args):
+    import load_balancing_algorithms as lba
+    from bounds import best_lower_bound
+
+    if args.tasks:
+        tasks, n_servers = args.tasks, args.servers
+        if n_servers is None:
+            raise SystemExit("--servers est requis avec --tasks")
+    else:
+        from instance_store import InstanceStore
+        instance = InstanceStore(args.suite)[args.instance]
+        tasks = instance['tasks']
+        n_servers = args.servers or instance['n_servers']
+
+    algorithm_func = getattr(lba, ALGORITHMS[args.algorithm])
+    params = _parse_params(args.param)
+    if args.counters and 'track_counters' in inspect.signature(algorithm_func).parameters:
+        params['track_counters'] = True
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    start_time = time.perf_counter()
+    solution = algorithm_func(tasks, n_servers, **params)
+    elapsed_time = time.perf_counter() - start_time
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+
+    lower_bound = best_lower_bound(tasks, n_servers)
+    makespan = solution.get_makespan()
+    print(f"Algorithme        : {args.algorithm}")
+    print(f"Instance          : {len(tasks)} tâches, {n_servers} serveurs")
+    print(f"Makespan          : {makespan}")
+    print(f"Borne inférieure  : {lower_bound}")
+    print(f"Gap               : {(makespan - lower_bound) / lower_bound * 100:.2f}%")
+    print(f"Temps             : {elapsed_time:.4f}s")
+    if n_servers <= 20:
+        print(f"Charges           : {solution.server_loads.tolist()}")
+    if solution.counters is not None:
+        counters = solution.counters
+        for name, n in counters['counts'].items():
+            print(f"  {name:28s}: {n:>12} ({counters['throughput'][name + '_per_s']:.0f}/s)")
+        for phase, elapsed in counters['phase_times'].items():
+            print(f"  temps {phase:22s}: {elapsed:12.6f}s")
+    if profiler is not None:
+        print(f"Profil cProfile   : {args.profile} (python -m pstats {args.profile})")
+
+
+def cmd_bench(args):
+    from benchmarking_complete import run_benchmark
+    run_benchmark(args.suite, n_workers=args.workers, checkpoint_dir=args.checkpoint_dir,
+                  time_budget=args.time_budget, repeats=args.repeats, warmup=args.warmup,
+                  measure_memory=not args.no_memory, collect_counters=args.counters,
+                  progress_options=progress_options(args),
+                  store_path=None if args.no_store else args.store, excel=args.excel,
+                  n_seeds=args.seeds, seed=args.seed, fitness_cache_size=args.fitness_cache)
+
+
+def cmd_report(args):
+    import os
+    import pandas as pd
+    from benchmarking_complete import JobCheckpoint, ResultStore, report_results
+
+    location = args.checkpoint_dir or args.store
+    if not os.path.exists(location):
+        raise SystemExit(f"Résultats introuvables : {location}")
+    # Une seule exécution (ou un seul jeu d'options) : pas de mélange de protocoles
+    latest = not args.all_runs
+    if args.checkpoint_dir:
+        results = JobCheckpoint(args.checkpoint_dir).load_all(options_hash=args.options, latest=latest)
+    else:
+        results = ResultStore(args.store).load_all(all_versions=args.all_versions, options_hash=args.options,
+                                                   latest=latest)
+    if not results:
+        raise SystemExit(f"Aucun résultat dans '{location}'")
+    selection = ('toutes exécutions confondues' if args.all_runs
+                 else f"options {args.options}" if args.options else "exécution la plus récente")
+    print(f"✅ {len(results)} résultats chargés depuis '{location}' ({selection})")
+    report_results(pd.DataFrame(results), excel=args.excel)
+
+
+def cmd_gate(args):
+    from regression_gate import run_gate
+    return run_gate(args.baseline, update=args.update, repeats=args.repeats, warmup=args.warmup,
+                    time_tolerance=args.time_tolerance, noise_factor=args.noise_factor,
+                    min_time_delta=args.min_time_delta, makespan_tolerance=args.makespan_tolerance)
+
+
+def cmd_sweep(args):
+    from scaling_sweep import fit_complexity, geometric_sizes, print_fits, run_sweep, sweep_algorithms
+
+    algorithms = sweep_algorithms([ALGORITHMS[name] for name in args.algorithms] if args.algorithms else None)
+    points = run_sweep(
+        algorithms,
+        task_sizes=geometric_sizes(args.min_tasks, args.max_tasks, args.task_points),
+        server_sizes=geometric_sizes(args.min_servers, args.max_servers, args.server_points),
+        fixed_servers=args.fixed_servers, fixed_tasks=args.fixed_tasks,
+        time_cap=args.time_cap, repeats=args.repeats, seed=args.seed,
+    )
+    budget = args.budget if args.budget is not None else args.time_cap
+    fits = fit_complexity(points, budget, fixed_servers=args.fixed_servers, min_time=args.min_time)
+    print_fits(fits, budget)
+    if args.output:
+        points.to_csv(args.output, index=False)
+        fits.to_csv(args.output.rsplit('.', 1)[0] + '_fits.csv', index_label='algorithm')
+        print(f"\n✅ Points et ajustements sauvegardés dans '{args.output}'")
+
+
+# ============================================
+# ANALYSE DES ARGUMENTS
+# ============================================
+
+def build_parser():
+    # Pas d'import lourd ici : les choix des options sont écrits en dur
+    parser = argparse.ArgumentParser(description="Load Balancing : génération, résolution et benchmarking")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    generate = subparsers.add_parser('generate', help="Générer une suite d'instances")
+    generate.add_argument('--large', action='store_true',
+                          help="Grandes instances (.npy + manifeste) au lieu de la suite JSON")
+    generate.add_argument('--plot', action='store_true', help="Visualiser la suite JSON")
+    generate.add_argument('--output-dir', default='large_benchmark', help="Dossier de sortie (--large)")
+    generate.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000],
+                          help="Nombres de tâches (--large)")
+    generate.add_argument('--distributions', nargs='+',
+                          default=['uniform', 'exponential', 'pareto', 'bimodal', 'near_identical'],
+                          help="Distributions des durées (--large)")
+    generate.add_argument('--seed', type=int, default=42)
+    generate.set_defaults(func=cmd_generate)
+
+    solve = subparsers.add_parser('solve', help="Résoudre une instance")
+    solve.add_argument('-a', '--algorithm', choices=sorted(ALGORITHMS), default='greedy')
+    solve.add_argument('--tasks', type=int, nargs='+', help="Durées des tâches")
+    solve.add_argument('-m', '--servers', type=int, default=None, help="Nombre de serveurs")
+    solve.add_argument('--suite', default='load_balancing_benchmark.json',
+                       help="Suite JSON ou manifeste (sans --tasks)")
+    solve.add_argument('--instance', default='instance_1', help="Identifiant de l'instance dans la suite")
+    solve.add_argument('-p', '--param', action='append', default=[],
+                       help="Paramètre de l'algorithme, ex. -p max_iterations=200 (répétable)")
+    solve.add_argument('--counters', action='store_true',
+                       help="Compteurs et temps par phase (greedy, tabu, genetic)")
+    solve.add_argument('--profile', default=None, metavar='FICHIER',
+                       help="Profil cProfile de la résolution, lisible avec pstats")
+    solve.set_defaults(func=cmd_solve)
+
+    bench = subparsers.add_parser('bench', help="Benchmark complet et rapport")
+    bench.add_argument('--suite', default='load_balancing_benchmark.json',
+                       help="Suite JSON ou manifeste de grandes instances")
+    bench.add_argument('--workers', type=int, default=1, help="Nombre de processus (défaut : 1)")
+    bench.add_argument('--store', default='benchmark_results.sqlite',
+                       help="Base de résultats : seuls les jobs absents ou modifiés sont calculés")
+    bench.add_argument('--no-store', action='store_true', help="Tout recalculer, sans base de résultats")
+    bench.add_argument('--checkpoint-dir', default=None,
+                       help="Reprise par fichiers JSON (un par job) au lieu de la base de résultats")
+    bench.add_argument('--excel', action='store_true', help="Exporter aussi benchmarking_results.xlsx")
+    bench.add_argument('--time-budget', type=float, default=None,
+                       help="Budget de temps par job (s) : comparaison à temps égal")
+    bench.add_argument('--repeats', type=int, default=1, help="Exécutions chronométrées par job (médiane)")
+    bench.add_argument('--warmup', type=int, default=0, help="Exécutions d'échauffement non mesurées")
+    bench.add_argument('--no-memory', action='store_true', help="Sauter la passe de mesure mémoire")
+    bench.add_argument('--counters', action='store_true', help="Compteurs et temps par phase des solveurs")
+    bench.add_argument('--fitness-cache', type=int, default=0, metavar='N',
+                       help="Cache de fitness du GA (N chromosomes, LRU) ; succès / échecs dans le rapport")
+    bench.add_argument('--seeds', type=int, default=1,
+                       help="Graines par algorithme stochastique (IC bootstrap et tests de Wilcoxon)")
+    bench.add_argument('--seed', type=int, default=0, help="Première graine (défaut : 0)")
+    add_progress_arguments(bench)
+    bench.set_defaults(func=cmd_bench)
+
+    report = subparsers.add_parser('report', help="Rapport à partir de résultats sauvegardés")
+    report.add_argument('--store', default='benchmark_results.sqlite', help="Base de résultats (voir bench)")
+    report.add_argument('--all-versions', action='store_true',
+                        help="Inclure les résultats d'anciennes versions du code")
+    report.add_argument('--checkpoint-dir', default=None,
+                        help="Lire un dossier de reprise JSON au lieu de la base")
+    report.add_argument('--options', default=None, metavar='EMPREINTE',
+                        help="Jeu d'options à rapporter (colonne options_hash, préfixe accepté) "
+                             "au lieu de la dernière exécution")
+    report.add_argument('--all-runs', action='store_true',
+                        help="Mélanger toutes les exécutions et options (déconseillé)")
+    report.add_argument('--excel', action='store_true', help="Exporter aussi benchmarking_results.xlsx")
+    report.set_defaults(func=cmd_report)
+
+    gate = subparsers.add_parser('gate', help="Détecter les régressions de temps ou de qualité")
+    gate.add_argument('--baseline', default='benchmark_baseline.json', help="Fichier de baseline")
+    gate.add_argument('--update', action='store_true', help="Enregistrer une nouvelle baseline")
+    gate.add_argument('--repeats', type=int, default=5, help="Exécutions chronométrées par job (médiane)")
+    gate.add_argument('--warmup', type=int, default=1, help="Exécutions d'échauffement non mesurées")
+    gate.add_argument('--time-tolerance', type=float, default=0.25,
+                      help="Ralentissement relatif toléré (défaut : 0.25, soit +25 %%)")
+    gate.add_argument('--noise-factor', type=float, default=3.0,
+                      help="Ralentissement toléré en multiples de l'IQR des temps (défaut : 3)")
+    gate.add_argument('--min-time-delta', type=float, default=0.001,
+                      help="Ralentissement absolu toujours toléré, en secondes (défaut : 0.001)")
+    gate.add_argument('--makespan-tolerance', type=float, default=0.0,
+                      help="Dégradation relative du makespan tolérée (défaut : 0)")
+    gate.set_defaults(func=cmd_gate)
+
+    sweep = subparsers.add_parser('sweep', help="Balayage de tailles et ajustement de complexité")
+    sweep.add_argument('-a', '--algorithms', nargs='+', choices=sorted(set(ALGORITHMS) - {'bnb'}),
+                       help="Algorithmes balayés (défaut : tous sauf le solveur exact)")
+    sweep.add_argument('--min-tasks', type=int, default=100)
+    sweep.add_argument('--max-tasks', type=int, default=1_000_000)
+    sweep.add_argument('--task-points', type=int, default=9, help="Tailles de l'axe n_tasks")
+    sweep.add_argument('--fixed-servers', type=int, default=10, help="n_servers pendant l'axe n_tasks")
+    sweep.add_argument('--min-servers', type=int, default=2)
+    sweep.add_argument('--max-servers', type=int, default=1024)
+    sweep.add_argument('--server-points', type=int, default=10, help="Tailles de l'axe n_servers")
+    sweep.add_argument('--fixed-tasks', type=int, default=5000, help="n_tasks pendant l'axe n_servers")
+    sweep.add_argument('--time-cap', type=float, default=5.0,
+                       help="Temps maximal d'un point (s) : la série s'arrête au premier dépassement")
+    sweep.add_argument('--budget', type=float, default=None,
+                       help="Budget (s) pour la plus grande instance résolue (défaut : --time-cap)")
+    sweep.add_argument('--min-time', type=float, default=1e-3,
+                       help="Points plus rapides exclus de l'ajustement (défaut : 0.001 s)")
+    sweep.add_argument('--repeats', type=int, default=1, help="Exécutions chronométrées par point (médiane)")
+    sweep.add_argument('--seed', type=int, default=0)
+    sweep.add_argument('--output', default=None, metavar='CSV', help="Sauvegarder les points (et *_fits.csv)")
+    sweep.set_defaults(func=cmd_sweep)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,144 @@
+"""
+Rendu des figures des rapports.
+
+Une figure est décrite par (fonction de rendu, fichier de sortie, données) ;
+render_figures la rend avec le backend non interactif Agg, dans un pool de
+processus, et saute celles dont les données et le code de rendu n'ont pas
+changé depuis le dernier rendu (empreintes dans .figure_cache.json).
+"""
+import hashlib
+import inspect
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+
+
+FIGURE_CACHE = '.figure_cache.json'
+
+# Points de progression au plus par courbe tracée
+MAX_PLOT_POINTS = 500
+
+
+def pyplot():
+    """matplotlib.pyplot sur le backend Agg : aucune fenêtre, rien ne bloque sans écran"""
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def downsample_progress(progress, max_points=MAX_PLOT_POINTS):
+    """
+    Réduit des colonnes de progression (voir ProgressRecorder) à environ
+    max_points points pour le tracé. On garde le début et la fin de chaque
+    palier du meilleur makespan (la courbe en escalier reste exacte), puis un
+    sous-échantillon régulier de ces points s'ils sont encore trop nombreux.
+    """
+    n_points = len(progress['step'])
+    if n_points <= max_points:
+        return progress
+    best = np.asarray(progress['best_makespan'], dtype=float)
+    changes = np.flatnonzero(best[1:] != best[:-1]) + 1
+    keep = np.unique(np.concatenate([[0, n_points - 1], changes, changes - 1]))
+    if len(keep) > max_points:
+        keep = keep[np.unique(np.linspace(0, len(keep) - 1, max_points).round().astype(np.int64))]
+    return {name: np.asarray(values)[keep] for name, values in progress.items()}
+
+
+# ============================================
+# EMPREINTES ET RENDU INCRÉMENTAL
+# ============================================
+
+def _jsonable(obj):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type non sérialisable : {type(obj).__name__}")
+
+
+def figure_hash(render_func, data):
+    """Empreinte d'une figure : code de la fonction de rendu et données tracées"""
+    digest = hashlib.sha256(inspect.getsource(render_func).encode('utf-8'))
+    digest.update(json.dumps(data, sort_keys=True, default=_jsonable).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _load_cache(cache_path):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache, cache_path):
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, cache_path)
+
+
+def _render_figure(render_func, out_path, data):
+    """Rend une figure ; fonction de module pour le pool"""
+    render_func(out_path, data)
+    return out_path
+
+
+def render_figures(figures, n_workers=None, cache_path=FIGURE_CACHE):
+    """
+    Rend une liste de figures (render_func, out_path, data), render_func
+    étant une fonction de module appelée render_func(out_path, data).
+
+    Une figure dont le fichier existe et dont l'empreinte (figure_hash) est
+    celle du dernier rendu est sautée. Les autres sont rendues dans un pool
+    de n_workers processus (défaut : un par cœur), ou dans ce processus s'il
+    n'y en a qu'une.
+
+    Returns:
+        liste des fichiers (re)générés
+    """
+    cache = _load_cache(cache_path) if cache_path else {}
+    pending = []
+    for render_func, out_path, data in figures:
+        digest = figure_hash(render_func, data)
+        if cache.get(out_path) == digest and os.path.exists(out_path):
+            print(f"↺ Graphique inchangé : {out_path}")
+        else:
+            pending.append((render_func, out_path, data, digest))
+    if not pending:
+        return []
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = min(n_workers, len(pending))
+    rendered = []
+
+    def finish(out_path, digest):
+        cache[out_path] = digest
+        rendered.append(out_path)
+        print(f"✅ Graphique sauvegardé : {out_path}")
+
+    if n_workers <= 1:
+        for render_func, out_path, data, digest in pending:
+            try:
+                _render_figure(render_func, out_path, data)
+                finish(out_path, digest)
+            except Exception as e:
+                print(f"✗ {out_path} | ERREUR: {str(e)}")
+    else:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = {executor.submit(_render_figure, render_func, out_path, data): (out_path, digest)
+                       for render_func, out_path, data, digest in pending}
+            for future in as_completed(futures):
+                out_path, digest = futures[future]
+                try:
+                    future.result()
+                    finish(out_path, digest)
+                except Exception as e:
+                    print(f"✗ {out_path} | ERREUR: {str(e)}")
+
+    if cache_path:
+        _save_cache(cache, cache_path)
+    return rendered
@@ -1,7 +1,5 @@
 import numpy as np
 import json
-import pandas as pd
-import matplotlib.pyplot as plt
 
 def generate_load_balancing_instance(n_tasks, n_servers, task_duration_range=(1, 100), seed=None):
     """
@@ -82,6 +80,8 @@ def save_benchmark_to_files(benchmark_suite, format='json'):
         print("✅ Benchmark sauvegardé dans 'load_balancing_benchmark.json'")
     
     elif format == 'csv':
+        import pandas as pd
+
         # Créer un DataFrame pour les statistiques
         stats = []
         for instance in benchmark_suite:
@@ -101,18 +101,33 @@ def save_benchmark_to_files(benchmark_suite, format='json'):
         df.to_csv('load_balancing_benchmark_stats.csv', index=False)
         print("✅ Statistiques sauvegardées dans 'load_balancing_benchmark_stats.csv'")
 
-def visualize_benchmark(benchmark_suite):
-    """
-    Visualise les caractéristiques du benchmark
-    """
+def benchmark_figure(benchmark_suite):
+    """Figure des caractéristiques du benchmark (voir figures.render_figures)"""
+    first_instance = benchmark_suite[0]
+    # Histogramme calculé ici : seuls 20 effectifs sont transmis au rendu
+    counts, edges = np.histogram(first_instance['tasks'], bins=20)
+    data = {
+        'n_tasks': [inst['n_tasks'] for inst in benchmark_suite],
+        'n_servers': [inst['n_servers'] for inst in benchmark_suite],
+        'total_loads': [int(np.sum(inst['tasks'])) for inst in benchmark_suite],
+        'lower_bounds': [float(np.sum(inst['tasks'])) / inst['n_servers'] for inst in benchmark_suite],
+        'first_description': first_instance['description'],
+        'histogram': {'counts': counts.tolist(), 'edges': edges.tolist()},
+    }
+    return _render_benchmark, 'benchmark_visualization.png', data
+
+
+def _render_benchmark(out_path, data):
+    """Rendu de benchmark_visualization.png"""
+    from figures import pyplot
+    plt = pyplot()
+
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
     # 1. Distribution des tailles d'instances
-    n_tasks = [inst['n_tasks'] for inst in benchmark_suite]
-    n_servers = [inst['n_servers'] for inst in benchmark_suite]
-    
-    axes[0, 0].bar(range(len(benchmark_suite)), n_tasks, alpha=0.7, label='Nombre de tâches')
-    axes[0, 0].bar(range(len(benchmark_suite)), n_servers, alpha=0.7, label='Nombre de serveurs')
+    n_instances = len(data['n_tasks'])
+    axes[0, 0].bar(range(n_instances), data['n_tasks'], alpha=0.7, label='Nombre de tâches')
+    axes[0, 0].bar(range(n_instances), data['n_servers'], alpha=0.7, label='Nombre de serveurs')
     axes[0, 0].set_xlabel('Instance')
     axes[0, 0].set_ylabel('Nombre')
     axes[0, 0].set_title('Tailles des Instances')
@@ -120,55 +135,71 @@ def visualize_benchmark(benchmark_suite):
     axes[0, 0].grid(True, alpha=0.3)
     
     # 2. Charge totale par instance
-    total_loads = [sum(inst['tasks']) for inst in benchmark_suite]
-    axes[0, 1].plot(range(len(benchmark_suite)), total_loads, marker='o', linewidth=2)
+    axes[0, 1].plot(range(n_instances), data['total_loads'], marker='o', linewidth=2)
     axes[0, 1].set_xlabel('Instance')
     axes[0, 1].set_ylabel('Charge Totale')
     axes[0, 1].set_title('Charge Totale par Instance')
     axes[0, 1].grid(True, alpha=0.3)
     
     # 3. Distribution des durées de tâches (première instance)
-    first_instance = benchmark_suite[0]
-    axes[1, 0].hist(first_instance['tasks'], bins=20, edgecolor='black', alpha=0.7)
+    edges = data['histogram']['edges']
+    axes[1, 0].hist(edges[:-1], bins=edges, weights=data['histogram']['counts'], edgecolor='black', alpha=0.7)
     axes[1, 0].set_xlabel('Durée de Tâche')
     axes[1, 0].set_ylabel('Fréquence')
-    axes[1, 0].set_title(f"Distribution des Durées - {first_instance['description']}")
+    axes[1, 0].set_title(f"Distribution des Durées - {data['first_description']}")
     axes[1, 0].grid(True, alpha=0.3)
     
     # 4. Borne inférieure optimale
-    lower_bounds = [sum(inst['tasks']) / inst['n_servers'] for inst in benchmark_suite]
-    axes[1, 1].plot(range(len(benchmark_suite)), lower_bounds, marker='s', linewidth=2, color='green')
+    axes[1, 1].plot(range(n_instances), data['lower_bounds'], marker='s', linewidth=2, color='green')
     axes[1, 1].set_xlabel('Instance')
     axes[1, 1].set_ylabel('Makespan Optimal (Borne Inf.)')
     axes[1, 1].set_title('Borne Inférieure Théorique')
     axes[1, 1].grid(True, alpha=0.3)
     
     plt.tight_layout()
-    plt.savefig('benchmark_visualization.png', dpi=300, bbox_inches='tight')
-    print("✅ Visualisation sauvegardée dans 'benchmark_visualization.png'")
-    plt.show()
-
-# Génération du benchmark complet
-print("🔧 Génération du benchmark de Load Balancing...\n")
-benchmark_suite = generate_benchmark_suite()
-
-# Affichage des informations
-print(f"📊 Nombre d'instances générées : {len(benchmark_suite)}\n")
-for instance in benchmark_suite:
-    print(f"  • {instance['description']}")
-    print(f"    - Total charge: {sum(instance['tasks'])}")
-    print(f"    - Borne inférieure optimale: {sum(instance['tasks']) / instance['n_servers']:.2f}")
-    print()
-
-# Sauvegarde
-save_benchmark_to_files(benchmark_suite, format='json')
-save_benchmark_to_files(benchmark_suite, format='csv')
-
-# Visualisation
-visualize_benchmark(benchmark_suite)
-
-print("\n✅ Benchmark généré avec succès!")
-print("📁 Fichiers créés:")
-print("   - load_balancing_benchmark.json")
-print("   - load_balancing_benchmark_stats.csv")
-print("   - benchmark_visualization.png")
\ No newline at end of file
+    plt.savefig(out_path, dpi=300, bbox_inches='tight')
+    plt.close(fig)
+
+
+def visualize_benchmark(benchmark_suite):
+    """
+    Visualise les caractéristiques du benchmark (benchmark_visualization.png),
+    sans rien refaire si la suite n'a pas changé
+    """
+    from figures import render_figures
+    return render_figures([benchmark_figure(benchmark_suite)])
+
+
+def main(visualize=True):
+    """Génère la suite, l'affiche, la sauvegarde (JSON + CSV) et la visualise"""
+    # Génération du benchmark complet
+    print("🔧 Génération du benchmark de Load Balancing...\n")
+    benchmark_suite = generate_benchmark_suite()
+
+    # Affichage des informations
+    print(f"📊 Nombre d'instances générées : {len(benchmark_suite)}\n")
+    for instance in benchmark_suite:
+        print(f"  • {instance['description']}")
+        print(f"    - Total charge: {sum(instance['tasks'])}")
+        print(f"    - Borne inférieure optimale: {sum(instance['tasks']) / instance['n_servers']:.2f}")
+        print()
+
+    # Sauvegarde
+    save_benchmark_to_files(benchmark_suite, format='json')
+    save_benchmark_to_files(benchmark_suite, format='csv')
+
+    # Visualisation
+    if visualize:
+        visualize_benchmark(benchmark_suite)
+
+    print("\n✅ Benchmark généré avec succès!")
+    print("📁 Fichiers créés:")
+    print("   - load_balancing_benchmark.json")
+    print("   - load_balancing_benchmark_stats.csv")
+    if visualize:
+        print("   - benchmark_visualization.png")
+    return benchmark_suite
+
+
+if __name__ == "__main__":
+    main()
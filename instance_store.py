@@ -0,0 +1,129 @@
+import json
+import os
+from collections.abc import Mapping, Sequence
+import numpy as np
+
+from bounds import best_lower_bound
+
+
+# ============================================
+# STATISTIQUES D'INSTANCE
+# ============================================
+
+def instance_stats(tasks, n_servers):
+    """
+    Statistiques résumées d'une instance (celles du manifeste) : charge
+    totale, meilleure borne inférieure, durées min / max / moyenne.
+    """
+    durations = np.asarray(tasks)
+    n_tasks = len(durations)
+    total_load = durations.sum().item()
+    return {
+        'total_load': total_load,
+        'lower_bound': best_lower_bound(durations, n_servers),
+        'min_duration': durations.min().item() if n_tasks else 0,
+        'max_duration': durations.max().item() if n_tasks else 0,
+        'mean_duration': total_load / n_tasks if n_tasks else 0.0,
+    }
+
+
+# ============================================
+# INSTANCES PARESSEUSES
+# ============================================
+
+class LazyInstance(Mapping):
+    """
+    Instance lue depuis un manifeste, utilisable comme le dict d'une suite
+    JSON (instance['tasks'], instance['n_servers'], ...). Le tableau des
+    durées n'est projeté en mémoire (np.load(mmap_mode='r')) qu'au premier
+    accès à 'tasks' ; les statistiques viennent du manifeste.
+
+    Une instance envoyée à un processus du pool ne transporte que ses
+    métadonnées : le processus projette lui-même le fichier.
+    """
+    __slots__ = ('metadata', 'path', '_tasks')
+
+    def __init__(self, metadata, path):
+        self.metadata = metadata
+        self.path = path
+        self._tasks = None
+
+    @property
+    def tasks(self):
+        if self._tasks is None:
+            self._tasks = np.load(self.path, mmap_mode='r')
+        return self._tasks
+
+    def __getitem__(self, key):
+        if key == 'tasks':
+            return self.tasks
+        return self.metadata[key]
+
+    def __iter__(self):
+        yield from self.metadata
+        yield 'tasks'
+
+    def __len__(self):
+        return len(self.metadata) + 1
+
+    def __getstate__(self):
+        return {'metadata': self.metadata, 'path': self.path}
+
+    def __setstate__(self, state):
+        self.metadata = state['metadata']
+        self.path = state['path']
+        self._tasks = None
+
+    def __repr__(self):
+        return f"LazyInstance({self.metadata.get('id')!r}, n_tasks={self.metadata.get('n_tasks')})"
+
+
+# ============================================
+# MAGASIN D'INSTANCES
+# ============================================
+
+class InstanceStore(Sequence):
+    """
+    Suite d'instances de benchmark, indexable par position ou par 'id'.
+
+    Deux formats sont lus par la même interface :
+    - un manifeste (manifest.json ou son dossier, voir large_scale_generator) :
+      les durées restent sur disque et sont projetées à la demande ;
+    - une suite JSON (load_balancing_benchmark.json) : chargée en entier,
+      chaque instance est complétée par les mêmes statistiques.
+    """
+    def __init__(self, path='load_balancing_benchmark.json'):
+        if os.path.isdir(path):
+            path = os.path.join(path, 'manifest.json')
+        self.path = path
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if isinstance(data, dict) and 'instances' in data:
+            directory = os.path.dirname(os.path.abspath(path))
+            self.instances = [LazyInstance(metadata, os.path.join(directory, metadata['file']))
+                              for metadata in data['instances']]
+        else:
+            self.instances = data
+        for instance in self.instances:
+            if 'lower_bound' not in instance:
+                # Manifeste ancien ou suite JSON : statistiques calculées une fois
+                stats = instance_stats(instance['tasks'], instance['n_servers'])
+                target = instance.metadata if isinstance(instance, LazyInstance) else instance
+                for name, value in stats.items():
+                    target.setdefault(name, value)
+        self._by_id = {instance['id']: i for i, instance in enumerate(self.instances) if 'id' in instance}
+
+    def __len__(self):
+        return len(self.instances)
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            index = self._by_id[index]
+        return self.instances[index]
+
+    def summary(self):
+        """Métadonnées et statistiques de chaque instance, sans lire les durées"""
+        return [{key: value for key, value in (instance.metadata if isinstance(instance, LazyInstance)
+                                               else instance).items() if key != 'tasks'}
+                for instance in self.instances]
@@ -0,0 +1,172 @@
+import json
+import os
+import numpy as np
+
+from bounds import best_lower_bound
+
+
+# ============================================
+# DISTRIBUTIONS DE DURÉES
+# ============================================
+
+DISTRIBUTIONS = ('uniform', 'exponential', 'pareto', 'bimodal', 'near_identical')
+
+# Taille des blocs écrits sur disque : borne la mémoire temporaire (≈ 8 Mo)
+CHUNK_SIZE = 1 << 20
+
+
+def sample_durations(rng, size, distribution='uniform', task_duration_range=(1, 100)):
+    """
+    Tire `size` durées entières dans [min, max] selon une distribution :
+    - uniform        : uniforme sur [min, max]
+    - exponential    : min + Exp(moyenne = (max - min) / 5), tronquée à max
+    - pareto         : min × (1 + Pareto(α = 1.5)), queue lourde tronquée à max
+    - bimodal        : 80 % de tâches courtes (premier cinquième de l'intervalle),
+                       20 % de tâches longues (dernier cinquième)
+    - near_identical : centre de l'intervalle ± 1 % de sa largeur
+    """
+    low, high = task_duration_range
+    span = high - low
+    if distribution == 'uniform':
+        return rng.integers(low, high + 1, size=size)
+    if distribution == 'exponential':
+        values = low + np.floor(rng.exponential(max(span, 1) / 5, size=size))
+    elif distribution == 'pareto':
+        values = np.round(max(low, 1) * (1 + rng.pareto(1.5, size=size)))
+    elif distribution == 'bimodal':
+        width = span // 5
+        long_tasks = rng.random(size) < 0.2
+        values = rng.integers(low, low + width + 1, size=size)
+        values[long_tasks] += high - width - low
+        return values
+    elif distribution == 'near_identical':
+        center = (low + high) // 2
+        width = max(1, span // 100)
+        values = rng.integers(center - width, center + width + 1, size=size)
+    else:
+        raise ValueError(f"Distribution inconnue : {distribution!r} (attendu : {', '.join(DISTRIBUTIONS)})")
+    return np.clip(values, low, high).astype(np.int64)
+
+
+def _duration_dtype(task_duration_range):
+    """int32 suffit pour les durées usuelles : moitié moins de disque que int64"""
+    return np.int32 if task_duration_range[1] <= np.iinfo(np.int32).max else np.int64
+
+
+# ============================================
+# GÉNÉRATION ET ÉCRITURE SUR DISQUE
+# ============================================
+
+def write_instance(path, n_tasks, rng, distribution='uniform', task_duration_range=(1, 100)):
+    """
+    Écrit les durées d'une instance dans un fichier .npy, bloc par bloc via
+    un memmap (aucune liste Python, mémoire bornée par CHUNK_SIZE).
+
+    Returns:
+        dict : statistiques calculées pendant l'écriture
+    """
+    durations = np.lib.format.open_memmap(path, mode='w+', dtype=_duration_dtype(task_duration_range),
+                                          shape=(n_tasks,))
+    total_load = 0
+    min_duration = None
+    max_duration = None
+    for start in range(0, n_tasks, CHUNK_SIZE):
+        chunk = sample_durations(rng, min(CHUNK_SIZE, n_tasks - start), distribution, task_duration_range)
+        durations[start:start + len(chunk)] = chunk
+        total_load += chunk.sum().item()
+        chunk_min, chunk_max = chunk.min().item(), chunk.max().item()
+        min_duration = chunk_min if min_duration is None else min(min_duration, chunk_min)
+        max_duration = chunk_max if max_duration is None else max(max_duration, chunk_max)
+    durations.flush()
+    del durations
+
+    return {
+        'total_load': total_load,
+        'min_duration': min_duration,
+        'max_duration': max_duration,
+        'mean_duration': total_load / n_tasks if n_tasks else 0.0,
+    }
+
+
+def large_scale_configurations(sizes=(100_000, 1_000_000, 10_000_000), distributions=DISTRIBUTIONS):
+    """
+    Configurations par défaut : chaque taille croisée avec chaque distribution,
+    environ 1000 tâches par serveur.
+    """
+    return [
+        (n_tasks, max(2, n_tasks // 1000), distribution)
+        for n_tasks in sizes
+        for distribution in distributions
+    ]
+
+
+def generate_large_scale_suite(output_dir='large_benchmark', configurations=None,
+                               task_duration_range=(1, 100), seed=42):
+    """
+    Génère une suite de grandes instances (10^5 à 10^7 tâches) : un fichier
+    .npy par instance et un petit manifeste JSON (manifest.json) décrivant
+    chaque instance et ses statistiques (charge totale, borne inférieure,
+    durées min / max / moyenne), lu par instance_store.InstanceStore.
+
+    Chaque instance a son propre numpy.random.Generator, issu de
+    SeedSequence(seed).spawn : une instance se régénère à l'identique sans
+    dépendre des autres.
+
+    Args:
+        output_dir: Dossier de sortie
+        configurations: Liste de (n_tasks, n_servers, distribution)
+        task_duration_range: Tuple (min, max) pour les durées des tâches
+        seed: Graine de la suite
+
+    Returns:
+        dict : le manifeste écrit
+    """
+    if configurations is None:
+        configurations = large_scale_configurations()
+    os.makedirs(output_dir, exist_ok=True)
+
+    seed_sequences = np.random.SeedSequence(seed).spawn(len(configurations))
+    instances = []
+    for i, ((n_tasks, n_servers, distribution), seed_sequence) in enumerate(zip(configurations, seed_sequences)):
+        instance_id = f"large_{i+1}"
+        filename = f"{instance_id}.npy"
+        path = os.path.join(output_dir, filename)
+        stats = write_instance(path, n_tasks, np.random.default_rng(seed_sequence), distribution, task_duration_range)
+        stats['lower_bound'] = best_lower_bound(np.load(path, mmap_mode='r'), n_servers)
+        instances.append({
+            'id': instance_id,
+            'description': f"{distribution} - {n_tasks} tâches, {n_servers} serveurs",
+            'n_tasks': n_tasks,
+            'n_servers': n_servers,
+            'distribution': distribution,
+            'task_duration_range': list(task_duration_range),
+            'file': filename,
+            'dtype': np.dtype(_duration_dtype(task_duration_range)).name,
+            **stats
+        })
+        print(f"  • {instances[-1]['description']} → {filename}")
+
+    manifest = {'format_version': 1, 'seed': seed, 'instances': instances}
+    tmp_path = os.path.join(output_dir, 'manifest.json.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, os.path.join(output_dir, 'manifest.json'))
+    return manifest
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Génération de grandes instances de Load Balancing")
+    parser.add_argument('--output-dir', default='large_benchmark', help="Dossier de sortie")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000],
+                        help="Nombres de tâches")
+    parser.add_argument('--distributions', nargs='+', choices=DISTRIBUTIONS, default=list(DISTRIBUTIONS))
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    print("🔧 Génération des grandes instances...\n")
+    manifest = generate_large_scale_suite(
+        args.output_dir, large_scale_configurations(args.sizes, args.distributions), seed=args.seed
+    )
+    print(f"\n✅ {len(manifest['instances'])} instances écrites dans '{args.output_dir}'")
@@ -1,151 +1,739 @@
+import cProfile
+import heapq
+import inspect
+import itertools
+import os
 import numpy as np
 import time
 import tracemalloc
-from copy import deepcopy
-import random
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from bounds import best_lower_bound, max_task_bound
 
 class LoadBalancingSolution:
-    """Représente une solution du problème de Load Balancing"""
+    """
+    Représente une solution du problème de Load Balancing
+
+    Représentation compacte : un vecteur int32 tâche → serveur (-1 si non
+    assignée) et un tableau NumPy des charges. Les listes de tâches par
+    serveur (assignment) ne sont construites qu'à la demande.
+    """
+    __slots__ = ('n_servers', 'tasks', 'task_server', 'server_loads', '_assignment', 'progress',
+                 'proven_optimal', 'counters', 'fitness_cache')
+
     def __init__(self, n_servers, tasks):
         self.n_servers = n_servers
-        self.tasks = tasks
-        self.assignment = [[] for _ in range(n_servers)]  # Tâches assignées à chaque serveur
-        self.server_loads = [0] * n_servers
+        self.tasks = np.asarray(tasks)
+        self.task_server = np.full(len(self.tasks), -1, dtype=np.int32)  # Serveur de chaque tâche
+        self.server_loads = np.zeros(n_servers, dtype=np.result_type(self.tasks.dtype, np.int64))
+        self._assignment = None
+        self.progress = None
+        self.proven_optimal = None  # Renseigné par le solveur exact
+        self.counters = None        # Renseigné avec track_counters=True (voir SolverCounters)
+        self.fitness_cache = None   # Statistiques du cache de fitness (GA)
+
+    @classmethod
+    def from_assignment(cls, n_servers, tasks, task_server, server_loads=None):
+        """
+        Construit une solution à partir d'un vecteur tâche → serveur.
+        Les charges sont calculées en un seul passage (bincount) si elles
+        ne sont pas fournies.
+        """
+        solution = cls(n_servers, tasks)
+        solution.task_server = np.asarray(task_server, dtype=np.int32).copy()
+        if server_loads is None:
+            assigned = solution.task_server >= 0
+            server_loads = np.bincount(solution.task_server[assigned], weights=solution.tasks[assigned],
+                                       minlength=n_servers)
+        solution.server_loads = np.asarray(server_loads).astype(solution.server_loads.dtype)
+        return solution
+
+    @property
+    def assignment(self):
+        """Tâches assignées à chaque serveur (listes construites à la demande)"""
+        if self._assignment is None:
+            assigned = np.flatnonzero(self.task_server >= 0)
+            servers = self.task_server[assigned]
+            order = np.argsort(servers, kind='stable')
+            bounds = np.cumsum(np.bincount(servers, minlength=self.n_servers))[:-1]
+            self._assignment = [chunk.tolist() for chunk in np.split(assigned[order], bounds)]
+        return self._assignment
     
     def assign_task(self, task_id, server_id):
-        """Assigne une tâche à un serveur"""
+        """Assigne une tâche à un serveur (la retire de son serveur précédent le cas échéant)"""
         task_duration = self.tasks[task_id]
-        self.assignment[server_id].append(task_id)
+        previous_server = self.task_server[task_id]
+        if previous_server >= 0:
+            self.server_loads[previous_server] -= task_duration
+        self.task_server[task_id] = server_id
         self.server_loads[server_id] += task_duration
+        self._assignment = None
     
     def get_makespan(self):
         """Retourne le makespan (charge maximale)"""
-        return max(self.server_loads)
+        return self.server_loads.max().item()
     
     def get_load_variance(self):
         """Retourne la variance des charges"""
         return np.var(self.server_loads)
     
     def copy(self):
-        """Crée une copie de la solution"""
-        new_sol = LoadBalancingSolution(self.n_servers, self.tasks)
-        new_sol.assignment = deepcopy(self.assignment)
+        """Crée une copie de la solution (copie mémoire des deux tableaux)"""
+        new_sol = LoadBalancingSolution.__new__(LoadBalancingSolution)
+        new_sol.n_servers = self.n_servers
+        new_sol.tasks = self.tasks
+        new_sol.task_server = self.task_server.copy()
         new_sol.server_loads = self.server_loads.copy()
+        new_sol._assignment = None
+        new_sol.progress = None
+        new_sol.proven_optimal = self.proven_optimal
+        new_sol.counters = None
+        new_sol.fitness_cache = None
         return new_sol
 
 
+def _deadline(time_limit, start_time):
+    """Instant (time.time()) où le budget de temps expire, None si illimité"""
+    return None if time_limit is None else start_time + time_limit
+
+
+def _iteration_range(max_iterations, time_limit):
+    """Itérations à parcourir : illimitées si seul un budget de temps est fixé"""
+    if max_iterations is not None:
+        return range(max_iterations)
+    if time_limit is None:
+        raise ValueError("max_iterations/max_generations=None exige un time_limit")
+    return itertools.count()
+
+
+class SolverCounters:
+    """
+    Instrumentation opt-in des solveurs (track_counters=True) : compteurs
+    d'événements (voisins évalués, rejets tabou, évaluations de fitness...)
+    et temps passé par phase, mesuré par tours (lap) avec time.perf_counter.
+
+    Désactivée, l'instrumentation se réduit à un test `counters is not None`
+    par itération : les boucles vectorisées ne comptent que par blocs.
+    """
+    __slots__ = ('counts', 'phase_times', '_start', '_last')
+
+    def __init__(self):
+        self.counts = {}
+        self.phase_times = {}
+        self._start = self._last = time.perf_counter()
+
+    def add(self, name, n=1):
+        self.counts[name] = self.counts.get(name, 0) + int(n)
+
+    def reset_lap(self):
+        """Début d'un tour : le temps écoulé depuis n'est attribué à aucune phase"""
+        self._last = time.perf_counter()
+
+    def lap(self, phase):
+        """Attribue à phase le temps écoulé depuis le tour précédent"""
+        now = time.perf_counter()
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + now - self._last
+        self._last = now
+
+    def merge(self, other):
+        """Ajoute les compteurs d'un autre objet (îles du GA : temps cumulés)"""
+        for name, n in other.counts.items():
+            self.add(name, n)
+        for phase, elapsed in other.phase_times.items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0.0) + elapsed
+
+    def to_dict(self):
+        """Compteurs, temps par phase et débits (événements par seconde)"""
+        elapsed_time = time.perf_counter() - self._start
+        return {
+            'counts': dict(self.counts),
+            'phase_times': {phase: round(elapsed, 6) for phase, elapsed in self.phase_times.items()},
+            'elapsed_time': round(elapsed_time, 6),
+            'throughput': {f"{name}_per_s": (n / elapsed_time if elapsed_time > 0 else float('inf'))
+                           for name, n in self.counts.items()},
+        }
+
+
+class ProgressRecorder:
+    """
+    Progression d'un solveur en colonnes NumPy préallouées : étape, makespan
+    courant, meilleur makespan et temps écoulé (plus, pour le GA en îles, le
+    meilleur makespan de chaque île). Les colonnes sont agrandies par
+    doublement ; aucun dict n'est créé par point.
+
+    Décimation (cumulable) :
+    - improvement_only : seuls les points où le meilleur makespan s'améliore ;
+    - log_points : points espacés logarithmiquement en étape, log_points
+      par décade ;
+    - max_points : au plus max_points points ; quand le tampon est plein, un
+      point sur deux est supprimé et le pas d'échantillonnage double.
+    Le dernier point reçu est toujours rendu par columns().
+    """
+    COLUMNS = ('step', 'current_makespan', 'best_makespan', 'elapsed_time')
+
+    def __init__(self, capacity=1024, max_points=None, log_points=None, improvement_only=False):
+        if max_points is not None and max_points < 2:
+            raise ValueError("max_points doit être >= 2")
+        if max_points is not None:
+            capacity = max_points
+        self.max_points = max_points
+        self.log_points = log_points
+        self.improvement_only = improvement_only
+        self._steps = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty((capacity, 3))  # Makespan courant, meilleur, temps
+        self._islands = None
+        self._size = 0
+        self._n_candidates = 0
+        self._stride = 1
+        self._next_log_step = 1
+        self._last_best = float('inf')
+        self._pending = None
+
+    def __len__(self):
+        return self._size + (self._pending is not None)
+
+    def record(self, step, current_makespan, best_makespan, elapsed_time, island_makespans=None):
+        point = (step, current_makespan, best_makespan, elapsed_time, island_makespans)
+        keep = not self.improvement_only or best_makespan < self._last_best
+        if keep and self.log_points is not None:
+            keep = step >= self._next_log_step
+            if keep:
+                self._next_log_step = max(step + 1, int(np.ceil(step * 10 ** (1 / self.log_points))))
+        if keep and self.max_points is not None:
+            keep = self._n_candidates % self._stride == 0
+            self._n_candidates += 1
+        if keep:
+            self._append(point)
+            self._pending = None
+        else:
+            self._pending = point
+
+    def _append(self, point):
+        step, current_makespan, best_makespan, elapsed_time, island_makespans = point
+        if self._size == len(self._steps):
+            if self.max_points is not None:
+                # Tampon plein : un point sur deux est conservé, pas doublé
+                kept = self._size // 2 + self._size % 2
+                self._steps[:kept] = self._steps[:self._size:2]
+                self._values[:kept] = self._values[:self._size:2]
+                if self._islands is not None:
+                    self._islands[:kept] = self._islands[:self._size:2]
+                self._size = kept
+                self._stride *= 2
+            else:
+                capacity = 2 * len(self._steps)
+                self._steps = np.resize(self._steps, capacity)
+                self._values = np.resize(self._values, (capacity, 3))
+                if self._islands is not None:
+                    self._islands = np.resize(self._islands, (capacity, self._islands.shape[1]))
+        if island_makespans is not None and self._islands is None:
+            self._islands = np.empty((len(self._steps), len(island_makespans)))
+        i = self._size
+        self._steps[i] = step
+        self._values[i] = (current_makespan, best_makespan, elapsed_time)
+        if island_makespans is not None:
+            self._islands[i] = island_makespans
+        self._size += 1
+        self._last_best = min(self._last_best, best_makespan)
+
+    def columns(self):
+        """Colonnes de la progression (copies), dernier point reçu compris"""
+        steps = self._steps[:self._size]
+        values = self._values[:self._size]
+        islands = self._islands[:self._size] if self._islands is not None else None
+        if self._pending is not None:
+            step, current_makespan, best_makespan, elapsed_time, island_makespans = self._pending
+            steps = np.append(steps, step)
+            values = np.vstack([values, (current_makespan, best_makespan, elapsed_time)])
+            if islands is not None:
+                islands = np.vstack([islands, island_makespans])
+        columns = {
+            'step': steps.copy(),
+            'current_makespan': values[:, 0].copy(),
+            'best_makespan': values[:, 1].copy(),
+            'elapsed_time': values[:, 2].copy(),
+        }
+        if islands is not None:
+            columns['island_makespans'] = islands.copy()
+        return columns
+
+
+def _progress_recorder(track_progress):
+    """
+    Enregistreur de progression d'un solveur : None si track_progress est
+    faux, sinon un ProgressRecorder (True, ou dict de ses paramètres, par
+    exemple {'max_points': 1000} ou {'improvement_only': True})
+    """
+    if not track_progress:
+        return None
+    if isinstance(track_progress, dict):
+        return ProgressRecorder(**track_progress)
+    return ProgressRecorder()
+
+
 # ============================================
 # 1. ALGORITHME GLOUTON (Greedy)
 # ============================================
 
-def greedy_load_balancing(tasks, n_servers, track_progress: bool = False):
+def lpt_order(tasks):
+    """
+    Ordre LPT : indices des tâches triés par durée décroissante.
+    Le tri est stable (à durée égale, l'ordre d'origine est conservé), ce qui
+    reproduit exactement sorted(..., reverse=True).
+    """
+    durations = np.asarray(tasks)
+    return np.argsort(-durations, kind='stable')
+
+
+def greedy_load_balancing(tasks, n_servers, track_progress: bool = False, order=None, time_limit=None,
+                          track_counters: bool = False):
     """
     Algorithme glouton : LPT (Longest Processing Time)
     Assigne chaque tâche au serveur le moins chargé
+
+    Le serveur le moins chargé est extrait d'un tas-min (charge, serveur) :
+    O(n log m) au lieu de O(n·m). À charge égale le plus petit indice de
+    serveur est choisi, comme np.argmin, donc l'assignation est identique.
+
+    Args:
+        tasks: Durées des tâches (liste ou tableau NumPy)
+        n_servers: Nombre de serveurs
+        track_progress: Enregistre le makespan après chaque assignation
+            (True, ou paramètres de décimation : voir ProgressRecorder)
+        order: Ordre LPT déjà calculé (voir lpt_order) pour éviter de retrier
+        time_limit: Accepté pour une interface commune avec les autres
+            solveurs ; la construction LPT n'est pas interrompue (une
+            assignation partielle ne serait pas une solution)
+        track_counters: Compte les assignations et chronomètre les phases
+            (tri, assignation, construction) dans solution.counters
     """
-    solution = LoadBalancingSolution(n_servers, tasks)
-    
+    start_time = time.time()
+    counters = SolverCounters() if track_counters else None
     # Trier les tâches par durée décroissante (LPT)
-    sorted_tasks = sorted(enumerate(tasks), key=lambda x: x[1], reverse=True)
+    order = lpt_order(tasks) if order is None else np.asarray(order)
+    durations = np.asarray(tasks)[order].tolist()
+    if counters is not None:
+        counters.lap('sort')
     
-    progress = [] if track_progress else None
-    for idx, (task_id, task_duration) in enumerate(sorted_tasks, start=1):
+    heap = [(0, server_id) for server_id in range(n_servers)]
+    servers = []
+    makespan = 0
+    progress = _progress_recorder(track_progress)
+    for idx, task_duration in enumerate(durations, start=1):
         # Trouver le serveur le moins chargé
-        min_server = np.argmin(solution.server_loads)
-        solution.assign_task(task_id, min_server)
-        if track_progress:
-            progress.append({
-                'step': idx,
-                'current_makespan': solution.get_makespan(),
-                'best_makespan': solution.get_makespan(),
-                'elapsed_time': None
-            })
-    
-    if track_progress:
-        solution.progress = progress
+        load, min_server = heap[0]
+        load += task_duration
+        heapq.heapreplace(heap, (load, min_server))
+        servers.append(min_server)
+        if load > makespan:
+            makespan = load
+        if progress is not None:
+            progress.record(idx, makespan, makespan, time.time() - start_time)
+    
+    if counters is not None:
+        counters.lap('assignment')
+        counters.add('assignments', len(durations))
+    
+    task_server = np.empty(len(order), dtype=np.int32)
+    task_server[order] = servers
+    server_loads = [0] * n_servers
+    for load, server_id in heap:
+        server_loads[server_id] = load
+    solution = LoadBalancingSolution.from_assignment(n_servers, tasks, task_server, server_loads)
+    
+    if progress is not None:
+        solution.progress = progress.columns()
+    if counters is not None:
+        counters.lap('build')
+        solution.counters = counters.to_dict()
     return solution
 
 
+# ============================================
+# RÉOPTIMISATION INCRÉMENTALE (démarrage à chaud)
+# ============================================
+
+def apply_task_delta(tasks, assignment, added=(), removed=(), resized=None, loads=None):
+    """
+    Applique un delta de tâches à une assignation existante.
+
+    Args:
+        tasks: Durées des tâches de l'instance précédente
+        assignment: Vecteur tâche → serveur de la solution précédente
+        added: Durées des nouvelles tâches (ajoutées en fin, non assignées)
+        removed: Identifiants (anciens) des tâches terminées
+        resized: Dictionnaire {identifiant ancien: nouvelle durée}
+        loads: Charges de la solution précédente ; mises à jour à partir
+            des seules tâches retirées et redimensionnées
+
+    Returns:
+        (durées, assignation avec -1 pour les nouvelles tâches, serveurs
+        modifiés, tâches redimensionnées conservées (nouveaux identifiants),
+        charges des tâches assignées ou None sans loads). Les tâches
+        conservées gardent leur ordre relatif.
+    """
+    durations = np.array(tasks)
+    assignment = np.asarray(assignment, dtype=np.int32)
+    changed_servers = set()
+    resized_ids = np.zeros(0, dtype=np.int64)
+    removed_ids = np.asarray(removed, dtype=np.int64) if len(removed) else np.zeros(0, dtype=np.int64)
+    if loads is not None:
+        loads = np.array(loads)
+    if resized:
+        resized_ids = np.fromiter(resized.keys(), dtype=np.int64, count=len(resized))
+        previous = durations[resized_ids]
+        durations = durations.astype(np.result_type(durations.dtype, np.asarray(list(resized.values())).dtype))
+        durations[resized_ids] = list(resized.values())
+        changed_servers.update(assignment[resized_ids].tolist())
+        if loads is not None:
+            loads = loads.astype(np.result_type(loads.dtype, durations.dtype))
+            servers = assignment[resized_ids]
+            placed = servers >= 0
+            np.add.at(loads, servers[placed], durations[resized_ids][placed] - previous[placed])
+    keep = np.ones(len(durations), dtype=bool)
+    if len(removed_ids):
+        keep[removed_ids] = False
+        changed_servers.update(assignment[removed_ids].tolist())
+        if loads is not None:
+            servers = assignment[removed_ids]
+            placed = servers >= 0
+            np.subtract.at(loads, servers[placed], durations[removed_ids][placed])
+    added = np.asarray(added, dtype=durations.dtype) if len(added) else np.zeros(0, dtype=durations.dtype)
+    new_durations = np.concatenate([durations[keep], added])
+    new_assignment = np.concatenate([assignment[keep], np.full(len(added), -1, dtype=np.int32)])
+    changed_servers.discard(-1)
+    # Nouvel identifiant d'une tâche conservée : ancien moins les tâches retirées avant elle
+    removed_sorted = np.unique(removed_ids)
+    resized_ids = resized_ids[keep[resized_ids]]
+    changed_tasks = resized_ids - np.searchsorted(removed_sorted, resized_ids)
+    return new_durations, new_assignment, changed_servers, changed_tasks, loads
+
+
+def _complete_assignment(durations, n_servers, assignment, loads=None):
+    """
+    Place les tâches non assignées (-1) d'une assignation existante par la
+    règle LPT sur les charges courantes (loads si fournies : charges des
+    tâches déjà assignées, sinon recalculées).
+
+    Returns:
+        (vecteur tâche → serveur complet, charges, tâches placées)
+    """
+    task_server = np.asarray(assignment, dtype=np.int32).copy()
+    if loads is None:
+        assigned = task_server >= 0
+        loads = np.bincount(task_server[assigned], weights=durations[assigned], minlength=n_servers)
+    loads = np.asarray(loads).astype(np.result_type(durations.dtype, np.int64))
+    unassigned = np.flatnonzero(task_server < 0)
+    if len(unassigned):
+        heap = [(load, server_id) for server_id, load in enumerate(loads.tolist())]
+        heapq.heapify(heap)
+        for task_id in unassigned[lpt_order(durations[unassigned])].tolist():
+            load, server_id = heap[0]
+            heapq.heapreplace(heap, (load + durations[task_id].item(), server_id))
+            task_server[task_id] = server_id
+        for load, server_id in heap:
+            loads[server_id] = load
+    return task_server, loads, unassigned
+
+
+def _group_by_server(task_order, task_server, n_servers):
+    """Tâches de chaque serveur, dans l'ordre de task_order"""
+    servers = task_server[task_order]
+    bounds = np.cumsum(np.bincount(servers, minlength=n_servers))[:-1]
+    return np.split(task_order[np.argsort(servers, kind='stable')], bounds)
+
+
 # ============================================
 # 2. RECHERCHE TABOU
 # ============================================
 
-def tabu_search_load_balancing(tasks, n_servers, max_iterations=100, tabu_tenure=10, track_progress: bool = False):
+def _top_loads(loads, k=3):
+    """
+    Retourne les k serveurs les plus chargés (indices, charges) par charge
+    décroissante, complétés par (-1, -inf) s'il y a moins de k serveurs.
+    """
+    top_idx = np.full(k, -1)
+    top_val = np.full(k, -np.inf)
+    order = np.argsort(-loads, kind='stable')[:k]
+    top_idx[:len(order)] = order
+    top_val[:len(order)] = loads[order]
+    return top_idx, top_val
+
+
+def _move_makespans(loads, server_from, durations_from, top_idx, top_val):
+    """
+    Évaluation delta du voisinage d'un serveur : makespan obtenu en déplaçant
+    chaque tâche de server_from vers chaque serveur, sans copier la solution.
+
+    Seules deux charges changent ; le maximum des autres serveurs se déduit
+    des trois plus grandes charges (les deux serveurs du mouvement exclus).
+
+    Returns:
+        Matrice (len(durations_from), n_servers) ; la colonne server_from vaut inf.
+    """
+    servers = np.arange(len(loads))
+    rest = np.where(
+        (top_idx[0] != server_from) & (top_idx[0] != servers), top_val[0],
+        np.where((top_idx[1] != server_from) & (top_idx[1] != servers), top_val[1], top_val[2])
+    )
+    from_loads = (loads[server_from] - durations_from).astype(float)
+    to_loads = (loads[None, :] + durations_from[:, None]).astype(float)
+    makespans = np.maximum(np.maximum(to_loads, from_loads[:, None]), rest[None, :])
+    makespans[:, server_from] = np.inf
+    return makespans
+
+
+def _server_sample(task_server, n_servers, server_id, k, start, pool=None):
+    """
+    Au plus k tâches du serveur server_id, lues par fenêtres croissantes à
+    partir de la position start (fenêtre tournante d'une itération à l'autre).
+
+    pool : tâches du serveur, utilisées comme indication (les identifiants
+    qui ne sont plus sur server_id sont ignorés). Sans pool, task_server est
+    balayé : environ 2·k·n_servers lectures pour des serveurs équilibrés,
+    quel que soit le nombre de tâches.
+    """
+    size = len(task_server) if pool is None else len(pool)
+    found = []
+    n_found = 0
+    position = start % size if size else 0
+    scanned = 0
+    window = 2 * k if pool is not None else 2 * k * n_servers
+    while n_found < k and scanned < size:
+        stop = min(position + window, size, position + size - scanned)
+        if pool is None:
+            hits = np.flatnonzero(task_server[position:stop] == server_id) + position
+        else:
+            ids = pool[position:stop]
+            ids = ids[ids < len(task_server)]
+            hits = ids[task_server[ids] == server_id]
+        found.append(hits)
+        n_found += len(hits)
+        scanned += stop - position
+        position = 0 if stop == size else stop
+        window *= 2
+    return np.concatenate(found)[:k] if found else np.zeros(0, dtype=np.int64)
+
+
+def _warm_blocks(task_server, loads, candidates, focus, members, pools, sample_size, iteration):
+    """
+    Voisinage à chaud : tâches candidates (modifiées, placées ou déplacées)
+    et au plus sample_size tâches de chaque serveur de focus et de chaque
+    serveur le plus chargé, regroupées par serveur courant. pools garde les
+    tâches de members déjà converties en tableau, serveur par serveur.
+
+    Returns:
+        liste de (serveur, tâches), serveurs et tâches par indice croissant
+    """
+    servers = focus.union(np.flatnonzero(loads == loads.max()).tolist())
+    samples = []
+    for server_id in sorted(servers):
+        pool = None
+        if members is not None:
+            if server_id not in pools:
+                pools[server_id] = np.asarray(members[server_id], dtype=np.int64)
+            pool = pools[server_id]
+        samples.append(_server_sample(task_server, len(loads), server_id, sample_size,
+                                      iteration * sample_size, pool))
+    task_ids = np.unique(np.concatenate([np.fromiter(candidates, dtype=np.int64, count=len(candidates))]
+                                        + samples))
+    task_servers = task_server[task_ids]
+    order = np.argsort(task_servers, kind='stable')
+    task_ids, task_servers = task_ids[order], task_servers[order]
+    if len(task_ids) == 0:
+        return []
+    splits = np.flatnonzero(np.diff(task_servers)) + 1
+    starts = np.concatenate([[0], splits])
+    return list(zip(task_servers[starts].tolist(), np.split(task_ids, splits)))
+
+
+def tabu_search_load_balancing(tasks, n_servers, max_iterations=100, tabu_tenure=10, track_progress: bool = False,
+                               time_limit=None, initial_assignment=None, changed_servers=None,
+                               max_migrations=None, track_counters: bool = False, stop_at_bound=True,
+                               changed_tasks=None, initial_loads=None, initial_members=None, sample_size=64):
     """
     Recherche Tabou pour Load Balancing
     Mouvement : transférer une tâche d'un serveur à un autre
+
+    Les voisins sont évalués par delta à partir des charges (voir
+    _move_makespans) ; seul le mouvement retenu est appliqué, en place.
+
+    Mémoire tabou par attribut : après le transfert d'une tâche de s vers s',
+    la tâche ne peut pas revenir sur s pendant tabu_tenure itérations. Le test
+    est en O(1) par voisin et l'expiration est implicite, ce qui permet des
+    tenures de plusieurs centaines d'itérations.
+
+    Mode anytime : avec time_limit (secondes), la recherche s'arrête à
+    l'expiration du budget et rend la meilleure solution trouvée ;
+    max_iterations=None laisse alors le budget seul décider.
+
+    La recherche s'arrête aussi dès que le makespan atteint la meilleure
+    borne inférieure (solution prouvée optimale, voir bounds.py), sauf avec
+    stop_at_bound=False : toutes les itérations sont alors exécutées (mesures
+    de temps du voisinage, voir scaling_sweep.py).
+
+    Démarrage à chaud : initial_assignment (voir apply_task_delta) remplace
+    la solution greedy ; ses tâches non assignées (-1) sont placées par LPT.
+    Le voisinage est alors limité aux tâches candidates (changed_tasks,
+    tâches placées ou déjà déplacées) et à au plus sample_size tâches de
+    chaque serveur modifié (changed_servers) et de chaque serveur le plus
+    chargé, prises par fenêtre tournante. initial_loads (charges des tâches
+    assignées, voir apply_task_delta) et initial_members (tâches de chaque
+    serveur dans la numérotation de tasks, simple indication pour
+    l'échantillon) évitent de les recalculer : le coût d'une itération
+    dépend de la taille du delta et de n_servers, et non plus du nombre de
+    tâches. max_migrations plafonne le nombre de tâches déplacées par
+    rapport à initial_assignment.
+
+    track_counters : solution.counters reçoit les voisins évalués, les rejets
+    tabou, les aspirations et le temps par phase (voir SolverCounters).
     """
-    n_tasks = len(tasks)
+    start_time = time.time()
+    deadline = _deadline(time_limit, start_time)
+    durations = np.asarray(tasks)
+    counters = SolverCounters() if track_counters else None
     
-    # Solution initiale (greedy)
-    current_solution = greedy_load_balancing(tasks, n_servers)
-    best_solution = current_solution.copy()
+    task_server = None
+    origin = None
+    if initial_assignment is None:
+        # Solution initiale (greedy) ; les tâches de chaque serveur sont gardées
+        # dans l'ordre d'insertion LPT, qui fixe l'ordre d'exploration
+        order = lpt_order(durations)
+        initial_solution = greedy_load_balancing(durations, n_servers, order=order)
+        members = _group_by_server(order, initial_solution.task_server, n_servers)
+        loads = initial_solution.server_loads.copy()
+        best_members = list(members)
+        lower_bound = best_lower_bound(durations, n_servers) if stop_at_bound else None
+    else:
+        # À chaud : vecteur tâche → serveur modifié en place, mouvements
+        # journalisés (la meilleure solution s'obtient en défaisant la fin)
+        task_server, loads, placed_tasks = _complete_assignment(durations, n_servers, initial_assignment,
+                                                                initial_loads)
+        focus = set(changed_servers or ())
+        candidates = set(placed_tasks.tolist())
+        if changed_tasks is not None:
+            candidates.update(np.asarray(changed_tasks).tolist())
+        member_pools = {}
+        moves = []
+        best_n_moves = 0
+        if max_migrations is not None:
+            origin = np.asarray(initial_assignment, dtype=np.int32)
+            n_migrations = 0
+        # Bornes moyenne et plus longue tâche : la borne des tiroirs trierait toutes les durées
+        lower_bound = (max(loads.sum().item() / n_servers, max_task_bound(durations))
+                       if stop_at_bound else None)
     
-    # Liste tabou : stocke les mouvements interdits
-    tabu_list = []
+    best_loads = loads.copy()
+    best_makespan = loads.max()
     
-    start_time = time.time()
-    progress = [] if track_progress else None
-    for iteration in range(max_iterations):
-        best_neighbor = None
+    # Mémoire tabou par attribut : la tâche t ne peut pas revenir sur le
+    # serveur tabu_server[t] tant que l'itération courante <= tabu_until[t]
+    tabu_server = np.full(len(durations), -1, dtype=np.int32)
+    tabu_until = np.full(len(durations), -1, dtype=np.int64)
+    
+    progress = _progress_recorder(track_progress)
+    if counters is not None:
+        counters.lap('initialization')
+    for iteration in _iteration_range(max_iterations, time_limit):
+        if deadline is not None and time.time() >= deadline:
+            break
+        if lower_bound is not None and best_makespan <= lower_bound:
+            break
+        if counters is not None:
+            counters.add('iterations')
+            counters.reset_lap()
         best_neighbor_makespan = float('inf')
         best_move = None
+        top_idx, top_val = _top_loads(loads)
         
-        # Explorer le voisinage
-        for server_from in range(n_servers):
-            if not current_solution.assignment[server_from]:
+        # Explorer le voisinage (restreint aux tâches candidates et échantillonnées à chaud)
+        if task_server is None:
+            blocks = enumerate(members)
+        else:
+            blocks = _warm_blocks(task_server, loads, candidates, focus, initial_members, member_pools,
+                                  sample_size, iteration)
+        for server_from, task_ids in blocks:
+            if len(task_ids) == 0:
                 continue
-                
-            for task_id in current_solution.assignment[server_from]:
-                for server_to in range(n_servers):
-                    if server_from == server_to:
-                        continue
-                    
-                    move = (task_id, server_from, server_to)
-                    
-                    # Créer une solution voisine
-                    neighbor = current_solution.copy()
-                    neighbor.assignment[server_from].remove(task_id)
-                    neighbor.server_loads[server_from] -= tasks[task_id]
-                    neighbor.assignment[server_to].append(task_id)
-                    neighbor.server_loads[server_to] += tasks[task_id]
-                    
-                    neighbor_makespan = neighbor.get_makespan()
-                    
-                    # Critère d'aspiration : accepter si meilleur que le meilleur global
-                    is_tabu = move in tabu_list
-                    aspiration = neighbor_makespan < best_solution.get_makespan()
-                    
-                    if (not is_tabu or aspiration) and neighbor_makespan < best_neighbor_makespan:
-                        best_neighbor = neighbor
-                        best_neighbor_makespan = neighbor_makespan
-                        best_move = move
+            
+            makespans = _move_makespans(loads, server_from, durations[task_ids], top_idx, top_val)
+            
+            # Plafond de migrations atteint : les tâches encore sur leur serveur d'origine restent
+            if origin is not None and n_migrations >= max_migrations:
+                makespans[origin[task_ids] == server_from] = np.inf
+            
+            # Critère d'aspiration : accepter si meilleur que le meilleur global
+            tabu_rows = np.flatnonzero(tabu_until[task_ids] >= iteration)
+            if len(tabu_rows):
+                tabu_cols = tabu_server[task_ids[tabu_rows]]
+                is_tabu = makespans[tabu_rows, tabu_cols] >= best_makespan
+                makespans[tabu_rows[is_tabu], tabu_cols[is_tabu]] = np.inf
+                if counters is not None:
+                    n_rejected = np.count_nonzero(is_tabu)
+                    counters.add('tabu_rejections', n_rejected)
+                    counters.add('aspiration_hits', len(is_tabu) - n_rejected)
+            if counters is not None:
+                counters.add('neighbors_evaluated', len(task_ids) * (n_servers - 1))
+            
+            # Premier minimum dans l'ordre d'exploration
+            flat_idx = int(np.argmin(makespans))
+            row, server_to = divmod(flat_idx, n_servers)
+            if makespans[row, server_to] < best_neighbor_makespan:
+                best_neighbor_makespan = makespans[row, server_to]
+                best_move = (int(task_ids[row]), server_from, server_to, row)
         
-        if best_neighbor is None:
+        if counters is not None:
+            counters.lap('evaluation')
+        if best_move is None:
             break
         
-        # Mettre à jour la solution courante
-        current_solution = best_neighbor
+        # Appliquer le mouvement sur la solution courante
+        task_id, server_from, server_to, row = best_move
+        loads[server_from] -= durations[task_id]
+        loads[server_to] += durations[task_id]
+        if task_server is None:
+            members[server_from] = np.delete(members[server_from], row)
+            members[server_to] = np.append(members[server_to], task_id)
+        else:
+            task_server[task_id] = server_to
+            candidates.add(task_id)
+            moves.append((task_id, server_from))
+        current_makespan = loads.max()
+        if origin is not None and origin[task_id] >= 0:
+            n_migrations += int(origin[task_id] != server_to) - int(origin[task_id] != server_from)
         
         # Mettre à jour la meilleure solution
-        if current_solution.get_makespan() < best_solution.get_makespan():
-            best_solution = current_solution.copy()
+        if current_makespan < best_makespan:
+            if task_server is None:
+                best_members = list(members)
+            else:
+                best_n_moves = len(moves)
+            best_loads = loads.copy()
+            best_makespan = current_makespan
         
-        # Gérer la liste tabou
-        if best_move:
-            tabu_list.append(best_move)
-            if len(tabu_list) > tabu_tenure:
-                tabu_list.pop(0)
-        if track_progress:
-            progress.append({
-                'step': iteration + 1,
-                'current_makespan': current_solution.get_makespan(),
-                'best_makespan': best_solution.get_makespan(),
-                'elapsed_time': time.time() - start_time
-            })
-    
-    if track_progress:
-        best_solution.progress = progress
+        # Interdire le retour de la tâche sur son serveur d'origine
+        # (expiration implicite après tabu_tenure itérations)
+        tabu_server[task_id] = server_from
+        tabu_until[task_id] = iteration + tabu_tenure
+        if counters is not None:
+            counters.add('moves_applied')
+            counters.lap('move')
+        if progress is not None:
+            progress.record(iteration + 1, current_makespan, best_makespan, time.time() - start_time)
+    
+    if task_server is None:
+        task_server = np.empty(len(durations), dtype=np.int32)
+        for server_id, task_ids in enumerate(best_members):
+            task_server[task_ids] = server_id
+    else:
+        for task_id, server_from in reversed(moves[best_n_moves:]):
+            task_server[task_id] = server_from
+    best_solution = LoadBalancingSolution.from_assignment(n_servers, durations, task_server, best_loads)
+    if progress is not None:
+        best_solution.progress = progress.columns()
+    if counters is not None:
+        best_solution.counters = counters.to_dict()
     return best_solution
 
 
@@ -153,168 +741,733 @@ def tabu_search_load_balancing(tasks, n_servers, max_iterations=100, tabu_tenure
 # 3. ALGORITHME GÉNÉTIQUE
 # ============================================
 
+def _population_loads(population, durations, n_servers):
+    """
+    Charges de toute la population en un seul bincount.
+    population : matrice (taille_population, n_tâches) des serveurs.
+    """
+    pop_size = population.shape[0]
+    offsets = population + (np.arange(pop_size) * n_servers)[:, None]
+    loads = np.bincount(offsets.ravel(), weights=np.tile(durations, pop_size),
+                        minlength=pop_size * n_servers)
+    return loads.reshape(pop_size, n_servers)
+
+
+def _delta_loads(base_loads, base_population, population, durations, n_servers, changed=None):
+    """
+    Charges d'individus dérivés de base_population : seuls les gènes modifiés
+    sont appliqués (retirés de l'ancien serveur, ajoutés au nouveau), pour un
+    coût proportionnel au nombre de gènes changés et non à n_tâches.
+    changed : gènes modifiés (lignes, colonnes) déjà calculés, éventuellement
+    restreints à certains individus.
+    """
+    rows, cols = np.nonzero(population != base_population) if changed is None else changed
+    loads = base_loads.copy()
+    if len(rows) == 0:
+        return loads
+    weights = durations[cols]
+    offsets = rows * n_servers
+    delta = (np.bincount(offsets + population[rows, cols], weights=weights, minlength=loads.size)
+             - np.bincount(offsets + base_population[rows, cols], weights=weights, minlength=loads.size))
+    loads += delta.reshape(loads.shape).astype(loads.dtype)
+    return loads
+
+
+# ============================================
+# CACHE DE FITNESS (empreintes incrémentales des chromosomes)
+# ============================================
+
+def _gene_keys(task_ids, servers):
+    """
+    Clé pseudo-aléatoire 64 bits de chaque gène (tâche, serveur), calculée
+    à la volée (mélangeur splitmix64) : aucune table n_tâches × n_serveurs.
+    """
+    z = (np.asarray(task_ids, dtype=np.uint64) << np.uint64(32)) + np.asarray(servers, dtype=np.uint64)
+    z = z + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _chromosome_hashes(population):
+    """Empreinte 64 bits de chaque chromosome : somme (modulo 2^64) des clés de ses gènes"""
+    population = np.atleast_2d(population)
+    return _gene_keys(np.arange(population.shape[1])[None, :], population).sum(axis=1, dtype=np.uint64)
+
+
+def _child_hashes(base_hashes, base_population, population, rows, cols):
+    """
+    Empreintes d'individus dérivés de base_population, mises à jour à partir
+    des seuls gènes modifiés (retrait de l'ancienne clé, ajout de la nouvelle)
+    """
+    hashes = base_hashes.copy()
+    np.add.at(hashes, rows, _gene_keys(cols, population[rows, cols]) - _gene_keys(cols, base_population[rows, cols]))
+    return hashes
+
+
+class _FitnessCache:
+    """
+    Cache LRU borné des charges par empreinte de chromosome. Une fois le GA
+    convergé, l'élite et de nombreux enfants répètent des chromosomes déjà
+    évalués : leurs charges sont recopiées au lieu d'être recalculées.
+    """
+    __slots__ = ('max_size', 'entries', 'hits', 'misses', 'evictions')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def store(self, chromosome_hash, loads):
+        self.entries[chromosome_hash] = loads
+        self.entries.move_to_end(chromosome_hash)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def evaluate(self, hashes, base_loads, base_population, population, durations, n_servers, rows, cols):
+        """
+        Charges des individus dérivés de base_population : les empreintes
+        connues (cache ou doublon du même lot) sont servies sans calcul, les
+        autres par _delta_loads restreint à leurs gènes modifiés.
+        """
+        cached = {}
+        duplicates = {}
+        first = {}
+        for i, chromosome_hash in enumerate(hashes.tolist()):
+            loads = self.entries.get(chromosome_hash)
+            if loads is not None:
+                self.entries.move_to_end(chromosome_hash)
+                cached[i] = loads
+                self.hits += 1
+            elif chromosome_hash in first:
+                duplicates[i] = first[chromosome_hash]
+                self.hits += 1
+            else:
+                first[chromosome_hash] = i
+                self.misses += 1
+        
+        to_compute = np.zeros(len(hashes), dtype=bool)
+        to_compute[list(first.values())] = True
+        selected = to_compute[rows]
+        loads = _delta_loads(base_loads, base_population, population, durations, n_servers,
+                             (rows[selected], cols[selected]))
+        for i, cached_loads in cached.items():
+            loads[i] = cached_loads
+        for i, source in duplicates.items():
+            loads[i] = loads[source]
+        for chromosome_hash, i in first.items():
+            self.store(chromosome_hash, loads[i].copy())
+        return loads
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.entries), 'max_size': self.max_size}
+
+
+def _merge_cache_stats(all_stats):
+    """Statistiques cumulées de plusieurs caches (îles), avec le taux de succès"""
+    merged = {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'max_size': 0}
+    for stats in all_stats:
+        for name in merged:
+            merged[name] += stats[name]
+    lookups = merged['hits'] + merged['misses']
+    merged['hit_rate'] = round(merged['hits'] / lookups, 4) if lookups else 0.0
+    return merged
+
+
+def _tournament_selection(fitnesses, n_winners, rng, tournament_size=3):
+    """Sélection par tournoi vectorisée : n_winners tournois sans remise"""
+    pop_size = len(fitnesses)
+    tournament_size = min(tournament_size, pop_size)
+    keys = rng.random((n_winners, pop_size))
+    candidates = np.argpartition(keys, tournament_size - 1, axis=1)[:, :tournament_size]
+    winners = np.argmax(fitnesses[candidates], axis=1)
+    return candidates[np.arange(n_winners), winners]
+
+
+def _uniform_crossover(parents1, parents2, rng):
+    """Croisement uniforme de tous les couples avec un seul masque aléatoire"""
+    mask = rng.random(parents1.shape) < 0.5
+    children = np.empty((2 * len(parents1), parents1.shape[1]), dtype=parents1.dtype)
+    children[0::2] = np.where(mask, parents1, parents2)
+    children[1::2] = np.where(mask, parents2, parents1)
+    return children
+
+
+def _mutate(population, n_servers, mutation_rate, rng):
+    """Mutation en place : chaque gène est réassigné avec probabilité mutation_rate"""
+    mask = rng.random(population.shape) < mutation_rate
+    population[mask] = rng.integers(0, n_servers, size=np.count_nonzero(mask))
+    return population
+
+
+class _Island:
+    """
+    Sous-population du GA : matrice de chromosomes, charges de chaque
+    individu, meilleur individu rencontré et générateur aléatoire propre.
+    Uniquement des tableaux NumPy, pour être transmise à bas coût entre
+    processus (modèle en îles).
+    """
+    __slots__ = ('population', 'loads', 'best_chromosome', 'best_loads', 'rng', 'counters',
+                 'cache', 'hashes', 'best_hash')
+
+    def __init__(self, population, loads, rng, counters=None, cache=None):
+        self.population = population
+        self.loads = loads
+        self.best_chromosome = None
+        self.best_loads = None
+        self.rng = rng
+        self.counters = counters  # SolverCounters optionnel, transmis avec l'île entre processus
+        # Cache de fitness optionnel et empreintes des chromosomes de la population
+        self.cache = cache
+        self.hashes = _chromosome_hashes(population) if cache is not None else None
+        self.best_hash = None
+        if cache is not None:
+            for chromosome_hash, loads_row in zip(self.hashes.tolist(), loads):
+                cache.store(chromosome_hash, loads_row.copy())
+
+    @property
+    def best_makespan(self):
+        return self.best_loads.max().item() if self.best_loads is not None else float('inf')
+
+    def evolve(self, durations, n_servers, n_generations, mutation_rate, deadline=None, target=None):
+        """
+        Fait évoluer la population pendant n_generations (ou jusqu'à deadline,
+        instant time.time() ; n_generations=None pour ne s'arrêter qu'au budget).
+        S'arrête dès que le meilleur makespan atteint target (borne inférieure).
+
+        Returns:
+            (meilleur makespan après chaque génération, temps écoulé en secondes)
+        """
+        population_size = len(self.population)
+        n_pairs = population_size // 2
+        best_history = []
+        time_history = []
+        start_time = time.time()
+        counters = self.counters
+        
+        for generation in _iteration_range(n_generations, deadline):
+            if deadline is not None and time.time() >= deadline:
+                break
+            if counters is not None:
+                counters.add('generations')
+                counters.reset_lap()
+            
+            # Évaluation : fitness = -makespan (à maximiser)
+            fitnesses = -self.loads.max(axis=1)
+            
+            # Mise à jour du meilleur
+            gen_best_idx = np.argmax(fitnesses)
+            if -fitnesses[gen_best_idx] < self.best_makespan:
+                self.best_chromosome = self.population[gen_best_idx].copy()
+                self.best_loads = self.loads[gen_best_idx].copy()
+                if self.hashes is not None:
+                    self.best_hash = self.hashes[gen_best_idx]
+            best_history.append(self.best_makespan)
+            time_history.append(time.time() - start_time)
+            if counters is not None:
+                counters.lap('evaluation')
+            if target is not None and self.best_makespan <= target:
+                break
+            
+            # Nouvelle génération : élitisme + enfants (l'enfant i dérive du parent i)
+            parents = _tournament_selection(fitnesses, 2 * n_pairs, self.rng)
+            parent_rows = self.population[parents]
+            if counters is not None:
+                counters.lap('selection')
+            children = _uniform_crossover(parent_rows[0::2], parent_rows[1::2], self.rng)
+            if counters is not None:
+                counters.lap('crossover')
+            children = _mutate(children, n_servers, mutation_rate, self.rng)
+            if counters is not None:
+                counters.lap('mutation')
+            rows, cols = np.nonzero(children != parent_rows)
+            if self.cache is None:
+                children_loads = _delta_loads(self.loads[parents], parent_rows, children, durations, n_servers,
+                                              (rows, cols))
+                n_evaluated = len(children)
+            else:
+                children_hashes = _child_hashes(self.hashes[parents], parent_rows, children, rows, cols)
+                misses = self.cache.misses
+                children_loads = self.cache.evaluate(children_hashes, self.loads[parents], parent_rows, children,
+                                                     durations, n_servers, rows, cols)
+                # Seuls les échecs du cache sont réellement évalués
+                n_evaluated = self.cache.misses - misses
+            if counters is not None:
+                counters.lap('evaluation')
+                counters.add('fitness_evaluations', n_evaluated)
+            
+            self.population = np.concatenate([self.best_chromosome[None, :], children])[:population_size]
+            self.loads = np.concatenate([self.best_loads[None, :], children_loads])[:population_size]
+            if self.cache is not None:
+                self.hashes = np.concatenate([[self.best_hash], children_hashes])[:population_size]
+            if counters is not None:
+                counters.lap('replacement')
+        
+        return best_history, time_history
+
+    def emigrants(self, n_migrants):
+        """Copies des n_migrants meilleurs individus (chromosomes, charges)"""
+        best = np.argsort(self.loads.max(axis=1), kind='stable')[:n_migrants]
+        return self.population[best].copy(), self.loads[best].copy()
+
+    def immigrate(self, chromosomes, loads):
+        """Remplace les pires individus par les migrants reçus (sans réévaluation)"""
+        worst = np.argsort(self.loads.max(axis=1), kind='stable')[::-1][:len(chromosomes)]
+        self.population[worst] = chromosomes[:len(worst)]
+        self.loads[worst] = loads[:len(worst)]
+        if self.hashes is not None:
+            self.hashes[worst] = _chromosome_hashes(chromosomes[:len(worst)])
+
+
+def _new_island(durations, n_servers, population_size, rng, seed_chromosomes=(), track_counters=False,
+                fitness_cache_size=None):
+    """
+    Population initiale aléatoire (éventuellement amorcée par un chromosome),
+    avec un cache de fitness LRU de fitness_cache_size entrées si non nul
+    """
+    counters = SolverCounters() if track_counters else None
+    population = rng.integers(0, n_servers, size=(population_size, len(durations)), dtype=np.int32)
+    for row, chromosome in enumerate(seed_chromosomes[:population_size]):
+        population[row] = chromosome
+    load_dtype = np.result_type(durations.dtype, np.int64)
+    loads = _population_loads(population, durations, n_servers).astype(load_dtype)
+    if counters is not None:
+        counters.lap('initialization')
+        counters.add('fitness_evaluations', population_size)
+    cache = _FitnessCache(fitness_cache_size) if fitness_cache_size else None
+    return _Island(population, loads, rng, counters, cache)
+
+
+def _migration_sources(island_id, n_islands, topology):
+    """Îles dont island_id reçoit les migrants selon la topologie"""
+    if topology == 'ring':
+        return [(island_id - 1) % n_islands]
+    if topology == 'fully_connected':
+        return [source for source in range(n_islands) if source != island_id]
+    raise ValueError(f"Topologie de migration inconnue : {topology!r}")
+
+
+_worker_durations = None
+
+
+def _init_island_worker(durations):
+    """Initialise un processus du pool : les durées ne sont envoyées qu'une fois"""
+    global _worker_durations
+    _worker_durations = durations
+
+
+def _evolve_island_worker(island, n_servers, n_generations, mutation_rate, deadline, target):
+    history = island.evolve(_worker_durations, n_servers, n_generations, mutation_rate, deadline, target)
+    return island, history
+
+
+def _island_model(durations, n_servers, population_size, max_generations, mutation_rate,
+                  seed, n_islands, migration_interval, migration_topology, n_migrants, n_workers,
+                  track_progress, seed_chromosomes, deadline=None, target=None, track_counters=False,
+                  fitness_cache_size=None):
+    """
+    Modèle en îles : n_islands sous-populations évoluent dans des processus
+    séparés et échangent leurs meilleurs individus toutes les
+    migration_interval générations. Chaque île a son propre générateur
+    (SeedSequence.spawn), donc le résultat ne dépend que de seed.
+
+    Returns:
+        (meilleur chromosome, ses charges, progression, compteurs,
+        statistiques du cache de fitness) ; compteurs et statistiques
+        cumulent ceux des îles
+    """
+    counters = SolverCounters() if track_counters else None
+    rngs = [np.random.default_rng(child) for child in np.random.SeedSequence(seed).spawn(n_islands)]
+    islands = [
+        _new_island(durations, n_servers, population_size, rng, seed_chromosomes if island_id == 0 else (),
+                    track_counters, fitness_cache_size)
+        for island_id, rng in enumerate(rngs)
+    ]
+    if n_workers is None:
+        n_workers = min(n_islands, os.cpu_count() or 1)
+    
+    executor = None
+    if n_workers > 1:
+        executor = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_island_worker,
+                                       initargs=(durations,))
+    start_time = time.time()
+    progress = _progress_recorder(track_progress)
+    try:
+        generation = 0
+        while max_generations is None or generation < max_generations:
+            if deadline is not None and time.time() >= deadline:
+                break
+            n_generations = migration_interval
+            if max_generations is not None:
+                n_generations = min(n_generations, max_generations - generation)
+            epoch_time = time.time() - start_time
+            if executor is None:
+                histories = [island.evolve(durations, n_servers, n_generations, mutation_rate, deadline, target)
+                             for island in islands]
+            else:
+                futures = [executor.submit(_evolve_island_worker, island, n_servers, n_generations,
+                                           mutation_rate, deadline, target)
+                           for island in islands]
+                results = [future.result() for future in futures]
+                islands = [island for island, _ in results]
+                histories = [history for _, history in results]
+            
+            # Au budget, les îles peuvent s'arrêter après des nombres de générations différents
+            n_done = max(len(best_history) for best_history, _ in histories)
+            if n_done == 0:
+                break
+            if progress is not None:
+                for step in range(n_done):
+                    island_best = [best_history[step] if step < len(best_history) else island.best_makespan
+                                   for island, (best_history, _) in zip(islands, histories)]
+                    elapsed_time = epoch_time + max(time_history[step] for _, time_history in histories
+                                                    if step < len(time_history))
+                    progress.record(generation + step + 1, min(island_best), min(island_best), elapsed_time,
+                                    island_best)
+            generation += n_done
+            if target is not None and min(island.best_makespan for island in islands) <= target:
+                break
+            
+            # Migration des meilleurs individus selon la topologie
+            if max_generations is None or generation < max_generations:
+                if counters is not None:
+                    counters.reset_lap()
+                outgoing = [island.emigrants(n_migrants) for island in islands]
+                for island_id, island in enumerate(islands):
+                    sources = _migration_sources(island_id, n_islands, migration_topology)
+                    island.immigrate(np.concatenate([outgoing[source][0] for source in sources]),
+                                     np.concatenate([outgoing[source][1] for source in sources]))
+                if counters is not None:
+                    counters.lap('migration')
+                    counters.add('migrations', n_islands)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    if counters is not None:
+        for island in islands:
+            counters.merge(island.counters)
+    cache_stats = None
+    if fitness_cache_size:
+        cache_stats = _merge_cache_stats(island.cache.stats() for island in islands)
+    best_island = min(islands, key=lambda island: island.best_makespan)
+    return best_island.best_chromosome, best_island.best_loads, progress, counters, cache_stats
+
+
 def genetic_algorithm_load_balancing(tasks, n_servers, population_size=50, 
                                      max_generations=100, mutation_rate=0.1,
-                                     track_progress: bool = False):
+                                     track_progress: bool = False, seed=None,
+                                     n_islands=1, migration_interval=10,
+                                     migration_topology='ring', n_migrants=1, n_workers=None,
+                                     time_limit=None, initial_assignment=None,
+                                     track_counters: bool = False, fitness_cache_size=0,
+                                     stop_at_bound=True):
     """
     Algorithme Génétique pour Load Balancing
     Chromosome : liste d'assignations [server_id pour chaque tâche]
+
+    La population est une matrice (population_size × n_tâches) d'entiers :
+    fitness, sélection, croisement et mutation sont calculés pour toute la
+    population à la fois. seed initialise le générateur NumPy (reproductible).
+
+    Chaque individu porte son vecteur de charges : l'élite n'est jamais
+    réévaluée et les charges d'un enfant sont dérivées de celles de son
+    parent en n'appliquant que les gènes modifiés (voir _delta_loads).
+
+    Modèle en îles (n_islands > 1) : n_islands populations de population_size
+    individus évoluent en parallèle sur n_workers processus et échangent leurs
+    n_migrants meilleurs individus toutes les migration_interval générations,
+    selon migration_topology ('ring' ou 'fully_connected').
+
+    Mode anytime : avec time_limit (secondes), l'évolution s'arrête à
+    l'expiration du budget et rend le meilleur individu trouvé ;
+    max_generations=None laisse alors le budget seul décider.
+
+    L'évolution s'arrête aussi dès que le makespan atteint la meilleure
+    borne inférieure (solution prouvée optimale, voir bounds.py), sauf avec
+    stop_at_bound=False : toutes les générations sont alors exécutées.
+
+    Démarrage à chaud : initial_assignment (voir apply_task_delta), complété
+    par LPT pour ses tâches non assignées, entre dans la population initiale
+    avant la solution greedy.
+
+    track_counters : solution.counters reçoit les évaluations de fitness, les
+    générations et le temps par phase (évaluation, sélection, croisement,
+    mutation, remplacement, migration) ; en modèle en îles, les temps de
+    phase sont cumulés sur toutes les îles.
+
+    Cache de fitness : les charges des fitness_cache_size derniers
+    chromosomes évalués sont gardées (LRU), indexées par une empreinte
+    64 bits mise à jour à partir des seuls gènes modifiés. Les chromosomes
+    répétés (élite, enfants identiques à un parent) ne sont pas recalculés ;
+    solution.fitness_cache donne succès, échecs et évictions. Désactivé par
+    défaut (fitness_cache_size=0) : avec croisement uniforme et mutation,
+    les répétitions sont rares tant que la population n'a pas convergé.
     """
-    n_tasks = len(tasks)
+    deadline = _deadline(time_limit, time.time())
+    durations = np.asarray(tasks)
+    lower_bound = best_lower_bound(durations, n_servers) if stop_at_bound else None
     
-    def create_random_solution():
-        """Crée un chromosome aléatoire"""
-        return [random.randint(0, n_servers - 1) for _ in range(n_tasks)]
+    # Inclure une solution greedy (et la solution précédente à chaud) dans la population initiale
+    seed_chromosomes = [greedy_load_balancing(durations, n_servers).task_server]
+    if initial_assignment is not None:
+        seed_chromosomes.insert(0, _complete_assignment(durations, n_servers, initial_assignment)[0])
     
-    def chromosome_to_solution(chromosome):
-        """Convertit un chromosome en solution"""
-        solution = LoadBalancingSolution(n_servers, tasks)
-        for task_id, server_id in enumerate(chromosome):
-            solution.assign_task(task_id, server_id)
-        return solution
+    if n_islands > 1:
+        best_chromosome, best_loads, progress, counters, cache_stats = _island_model(
+            durations, n_servers, population_size, max_generations, mutation_rate, seed,
+            n_islands, migration_interval, migration_topology, n_migrants, n_workers, track_progress,
+            seed_chromosomes, deadline, lower_bound, track_counters, fitness_cache_size
+        )
+    else:
+        island = _new_island(durations, n_servers, population_size, np.random.default_rng(seed),
+                             seed_chromosomes, track_counters, fitness_cache_size)
+        counters = island.counters
+        best_history, time_history = island.evolve(durations, n_servers, max_generations, mutation_rate,
+                                                   deadline, lower_bound)
+        cache_stats = _merge_cache_stats([island.cache.stats()]) if island.cache is not None else None
+        best_chromosome, best_loads = island.best_chromosome, island.best_loads
+        progress = _progress_recorder(track_progress)
+        if progress is not None:
+            for generation, (best_makespan, elapsed_time) in enumerate(zip(best_history, time_history)):
+                progress.record(generation + 1, best_makespan, best_makespan, elapsed_time)
     
-    def fitness(chromosome):
-        """Fonction de fitness : inverse du makespan (à maximiser)"""
-        solution = chromosome_to_solution(chromosome)
-        return -solution.get_makespan()  # Négatif car on minimise makespan
-    
-    def selection(population, fitnesses):
-        """Sélection par tournoi"""
-        tournament_size = 3
-        selected = []
-        for _ in range(2):
-            tournament = random.sample(list(zip(population, fitnesses)), tournament_size)
-            winner = max(tournament, key=lambda x: x[1])
-            selected.append(winner[0])
-        return selected
-    
-    def crossover(parent1, parent2):
-        """Croisement uniforme"""
-        child1 = []
-        child2 = []
-        for i in range(n_tasks):
-            if random.random() < 0.5:
-                child1.append(parent1[i])
-                child2.append(parent2[i])
-            else:
-                child1.append(parent2[i])
-                child2.append(parent1[i])
-        return child1, child2
-    
-    def mutate(chromosome):
-        """Mutation : change l'assignation d'une tâche aléatoire"""
-        mutated = chromosome.copy()
-        for i in range(n_tasks):
-            if random.random() < mutation_rate:
-                mutated[i] = random.randint(0, n_servers - 1)
-        return mutated
-    
-    # Initialisation de la population
-    population = [create_random_solution() for _ in range(population_size)]
-    
-    # Inclure une solution greedy dans la population initiale
-    greedy_sol = greedy_load_balancing(tasks, n_servers)
-    greedy_chromosome = []
-    for server_id, task_list in enumerate(greedy_sol.assignment):
-        for task_id in task_list:
-            greedy_chromosome.append((task_id, server_id))
-    greedy_chromosome.sort()
-    population[0] = [server_id for _, server_id in greedy_chromosome]
-    
-    best_chromosome = None
-    best_fitness = float('-inf')
+    if best_chromosome is None:
+        best_chromosome, best_loads = seed_chromosomes[0], None
+    sol = LoadBalancingSolution.from_assignment(n_servers, durations, best_chromosome, best_loads)
+    if progress is not None:
+        sol.progress = progress.columns()
+    if counters is not None:
+        sol.counters = counters.to_dict()
+    if cache_stats is not None:
+        sol.fitness_cache = cache_stats
+    return sol
+
+
+# ============================================
+# 4. SOLVEUR EXACT (Branch and Bound)
+# ============================================
+
+def _branch_servers(loads, task_duration, upper_bound):
+    """
+    Serveurs à essayer pour une tâche, du moins chargé au plus chargé.
+    Symétries : un seul serveur par valeur de charge (serveurs vides
+    compris). Élagage : on s'arrête dès que la tâche ferait atteindre
+    upper_bound (les serveurs suivants sont plus chargés).
+    """
+    servers = []
+    seen_loads = set()
+    for server_id in sorted(range(len(loads)), key=loads.__getitem__):
+        load = loads[server_id]
+        if load + task_duration >= upper_bound:
+            break
+        if load not in seen_loads:
+            seen_loads.add(load)
+            servers.append(server_id)
+    return servers
+
+
+def branch_and_bound_load_balancing(tasks, n_servers, node_limit=1_000_000, time_limit=None,
+                                    track_progress: bool = False):
+    """
+    Solveur exact par séparation et évaluation (Branch and Bound)
+    Parcours en profondeur des tâches dans l'ordre LPT, solution initiale
+    greedy, élimination des serveurs symétriques (même charge) et élagage
+    dès qu'une branche ne peut plus battre la meilleure solution.
+
+    La recherche s'arrête quand la solution atteint la meilleure borne
+    inférieure (bounds.py) ou quand l'arbre est épuisé : la solution est
+    alors prouvée optimale (solution.proven_optimal = True). Si node_limit
+    ou time_limit est atteint avant, la meilleure solution trouvée est
+    rendue avec proven_optimal = False.
+    """
     start_time = time.time()
-    progress = [] if track_progress else None
+    deadline = _deadline(time_limit, start_time)
+    durations = np.asarray(tasks)
+    n_tasks = len(durations)
     
-    # Évolution
-    for generation in range(max_generations):
-        # Évaluation
-        fitnesses = [fitness(chrom) for chrom in population]
+    # Solution initiale (greedy) : première borne supérieure
+    order = lpt_order(durations)
+    greedy_sol = greedy_load_balancing(durations, n_servers, order=order)
+    best_task_server = greedy_sol.task_server.copy()
+    upper_bound = greedy_sol.get_makespan()
+    lower_bound = best_lower_bound(durations, n_servers)
+    
+    sorted_durations = durations[order].tolist()
+    loads = [0] * n_servers
+    chosen = [-1] * n_tasks
+    nodes = 0
+    exhausted = upper_bound <= lower_bound or n_tasks == 0
+    progress = _progress_recorder(track_progress)
+    if progress is not None:
+        progress.record(0, upper_bound, upper_bound, time.time() - start_time)
+    
+    # Pile des serveurs candidats restants à chaque profondeur
+    stack = [] if exhausted else [iter(_branch_servers(loads, sorted_durations[0], upper_bound))]
+    while stack:
+        depth = len(stack) - 1
+        task_duration = sorted_durations[depth]
+        if chosen[depth] >= 0:
+            loads[chosen[depth]] -= task_duration
+            chosen[depth] = -1
         
-        # Mise à jour du meilleur
-        gen_best_idx = np.argmax(fitnesses)
-        if fitnesses[gen_best_idx] > best_fitness:
-            best_fitness = fitnesses[gen_best_idx]
-            best_chromosome = population[gen_best_idx].copy()
-        if track_progress:
-            current_best_makespan = -best_fitness
-            progress.append({
-                'step': generation + 1,
-                'current_makespan': current_best_makespan,
-                'best_makespan': current_best_makespan,
-                'elapsed_time': time.time() - start_time
-            })
+        server_id = next(stack[-1], None)
+        if server_id is None or loads[server_id] + task_duration >= upper_bound:
+            stack.pop()
+            continue
         
-        # Nouvelle génération
-        new_population = []
+        loads[server_id] += task_duration
+        chosen[depth] = server_id
+        nodes += 1
         
-        # Élitisme : garder le meilleur
-        new_population.append(best_chromosome)
+        if depth + 1 == n_tasks:
+            # Feuille : nouvelle meilleure solution (toutes les charges < upper_bound)
+            upper_bound = max(loads)
+            best_task_server[order] = chosen
+            if progress is not None:
+                progress.record(nodes, upper_bound, upper_bound, time.time() - start_time)
+            if upper_bound <= lower_bound:
+                break
+        else:
+            stack.append(iter(_branch_servers(loads, sorted_durations[depth + 1], upper_bound)))
         
-        while len(new_population) < population_size:
-            # Sélection
-            parent1, parent2 = selection(population, fitnesses)
-            
-            # Croisement
-            child1, child2 = crossover(parent1, parent2)
-            
-            # Mutation
-            child1 = mutate(child1)
-            child2 = mutate(child2)
-            
-            new_population.extend([child1, child2])
-        
-        population = new_population[:population_size]
+        if nodes >= node_limit or (deadline is not None and nodes % 1024 == 0 and time.time() >= deadline):
+            break
+    else:
+        exhausted = True
     
-    sol = chromosome_to_solution(best_chromosome)
-    if track_progress:
-        sol.progress = progress
-    return sol
+    solution = LoadBalancingSolution.from_assignment(n_servers, durations, best_task_server)
+    solution.proven_optimal = exhausted or solution.get_makespan() <= lower_bound
+    if progress is not None:
+        solution.progress = progress.columns()
+    return solution
 
 
 # ============================================
 # FONCTION D'ÉVALUATION AVEC MÉTRIQUES
 # ============================================
 
-def evaluate_algorithm(algorithm_func, tasks, n_servers, algorithm_name, track_progress: bool = False, **kwargs):
+def _budget_kwargs(algorithm_func, time_budget, kwargs):
+    """
+    Paramètres pour une comparaison à budget de temps égal : time_limit est
+    fixé et les plafonds d'itérations/générations sont levés.
+    """
+    parameters = inspect.signature(algorithm_func).parameters
+    kwargs = dict(kwargs)
+    if 'time_limit' in parameters:
+        kwargs['time_limit'] = time_budget
+    for cap in ('max_iterations', 'max_generations'):
+        if cap in parameters:
+            kwargs[cap] = None
+    return kwargs
+
+
+def _timing_stats(times):
+    """Médiane, écart interquartile et minimum de temps d'exécution"""
+    q1, median, q3 = np.percentile(times, [25, 50, 75])
+    return {
+        'execution_time': round(float(median), 6),
+        'execution_time_iqr': round(float(q3 - q1), 6),
+        'execution_time_min': round(float(min(times)), 6),
+    }
+
+
+def evaluate_algorithm(algorithm_func, tasks, n_servers, algorithm_name, track_progress: bool = False,
+                       time_budget=None, repeats=1, warmup=0, measure_memory=True,
+                       collect_counters=False, profile_path=None, **kwargs):
     """
     Évalue un algorithme et retourne les métriques
+
+    time_budget (secondes) : compare les algorithmes à temps égal plutôt
+    qu'à nombre d'itérations égal (voir _budget_kwargs).
+
+    Le temps et la mémoire sont mesurés dans des passes séparées :
+    - temps : `warmup` exécutions ignorées puis `repeats` exécutions
+      chronométrées avec time.perf_counter ; execution_time est la médiane,
+      avec l'écart interquartile et le minimum ;
+    - mémoire (measure_memory) : une exécution supplémentaire sous
+      tracemalloc, dont le surcoût ne pèse donc pas sur les temps.
+    Toutes les passes (temps, mémoire, profilage) exécutent la même
+    configuration, progression et compteurs compris.
+    La solution retournée est celle de la première exécution chronométrée.
+
+    collect_counters : active l'instrumentation des solveurs qui la proposent
+    (track_counters) ; results['counters'] contient alors compteurs, temps par
+    phase et débits. profile_path : une exécution supplémentaire sous
+    cProfile, dont les statistiques sont écrites dans ce fichier (pstats).
     """
-    # Mesure du temps
-    start_time = time.time()
+    if repeats < 1:
+        raise ValueError("repeats doit être >= 1")
+    if time_budget is not None:
+        kwargs = _budget_kwargs(algorithm_func, time_budget, kwargs)
+    parameters = inspect.signature(algorithm_func).parameters
+    run_kwargs = dict(kwargs)
+    if 'track_progress' in parameters:
+        run_kwargs['track_progress'] = track_progress
+    if collect_counters and 'track_counters' in parameters:
+        run_kwargs['track_counters'] = True
     
-    # Mesure de la mémoire
-    tracemalloc.start()
+    # Passe de temps : échauffement puis exécutions chronométrées
+    for _ in range(warmup):
+        algorithm_func(tasks, n_servers, **run_kwargs)
+    times = []
+    solution = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        run_solution = algorithm_func(tasks, n_servers, **run_kwargs)
+        times.append(time.perf_counter() - start_time)
+        if solution is None:
+            solution = run_solution
     
-    # Exécution de l'algorithme
-    try:
-        solution = algorithm_func(tasks, n_servers, track_progress=track_progress, **kwargs)
-    except TypeError:
-        solution = algorithm_func(tasks, n_servers, **kwargs)
+    # Passe de mémoire, séparée (tracemalloc ralentit les allocations)
+    peak = None
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            algorithm_func(tasks, n_servers, **run_kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
     
-    # Fin des mesures
-    execution_time = time.time() - start_time
-    current, peak = tracemalloc.get_traced_memory()
-    tracemalloc.stop()
+    # Passe de profilage, séparée elle aussi
+    if profile_path is not None:
+        profiler = cProfile.Profile()
+        profiler.runcall(algorithm_func, tasks, n_servers, **run_kwargs)
+        profiler.dump_stats(profile_path)
     
     # Calcul des métriques
     makespan = solution.get_makespan()
     load_variance = solution.get_load_variance()
-    optimal_lower_bound = sum(tasks) / n_servers
+    optimal_lower_bound = best_lower_bound(tasks, n_servers)
     optimality_gap = ((makespan - optimal_lower_bound) / optimal_lower_bound) * 100
     
     results = {
         'algorithm': algorithm_name,
         'makespan': makespan,
         'load_variance': round(load_variance, 2),
-        'execution_time': round(execution_time, 4),
-        'memory_peak_mb': round(peak / 1024 / 1024, 4),
+        **_timing_stats(times),
+        'repeats': repeats,
+        'memory_peak_mb': round(peak / 1024 / 1024, 4) if peak is not None else None,
         'optimal_lower_bound': round(optimal_lower_bound, 2),
         'optimality_gap_%': round(optimality_gap, 2),
-        'server_loads': solution.server_loads
+        'server_loads': np.asarray(solution.server_loads).tolist()
     }
-    if hasattr(solution, 'progress'):
+    if time_budget is not None:
+        results['time_budget'] = time_budget
+    if getattr(solution, 'proven_optimal', None) is not None:
+        results['proven_optimal'] = solution.proven_optimal
+    if getattr(solution, 'progress', None) is not None:
         results['progress'] = solution.progress
+    if getattr(solution, 'counters', None) is not None:
+        results['counters'] = solution.counters
+    if getattr(solution, 'fitness_cache', None) is not None:
+        results['fitness_cache'] = solution.fitness_cache
+    if profile_path is not None:
+        results['profile_path'] = profile_path
     
     return results, solution
 
@@ -334,13 +1487,14 @@ if __name__ == "__main__":
     print(f"\n📊 Problème : {len(tasks)} tâches, {n_servers} serveurs")
     print(f"Tâches : {tasks}")
     print(f"Charge totale : {sum(tasks)}")
-    print(f"Borne inférieure optimale : {sum(tasks) / n_servers:.2f}\n")
+    print(f"Borne inférieure optimale : {best_lower_bound(tasks, n_servers):.2f}\n")
     
     # Test des algorithmes
     algorithms = [
         (greedy_load_balancing, "Algorithme Glouton (LPT)", {}),
         (tabu_search_load_balancing, "Recherche Tabou", {'max_iterations': 100, 'tabu_tenure': 10}),
-        (genetic_algorithm_load_balancing, "Algorithme Génétique", {'population_size': 50, 'max_generations': 100})
+        (genetic_algorithm_load_balancing, "Algorithme Génétique", {'population_size': 50, 'max_generations': 100}),
+        (branch_and_bound_load_balancing, "Branch and Bound (exact)", {'node_limit': 1_000_000})
     ]
     
     for algo_func, algo_name, params in algorithms:
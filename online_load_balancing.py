@@ -0,0 +1,287 @@
+import time
+import numpy as np
+
+from load_balancing_algorithms import LoadBalancingSolution
+
+
+# ============================================
+# TAS INDEXÉ (charges des serveurs)
+# ============================================
+
+class IndexedHeap:
+    """
+    Tas binaire de serveurs indexé par identifiant : la charge d'un serveur
+    peut être modifiée ou le serveur retiré en O(log m). sign=1 donne un
+    tas-min, sign=-1 un tas-max ; à clé égale le plus petit identifiant
+    est au sommet (même règle que le glouton).
+    """
+    def __init__(self, sign=1):
+        self.sign = sign
+        self.heap = []        # Identifiants de serveurs
+        self.positions = {}   # Serveur -> position dans le tas
+        self.keys = {}        # Serveur -> charge
+
+    def __len__(self):
+        return len(self.heap)
+
+    def _less(self, a, b):
+        return (self.sign * self.keys[a], a) < (self.sign * self.keys[b], b)
+
+    def _swap(self, i, j):
+        heap = self.heap
+        heap[i], heap[j] = heap[j], heap[i]
+        self.positions[heap[i]] = i
+        self.positions[heap[j]] = j
+
+    def _sift_up(self, i):
+        while i > 0:
+            parent = (i - 1) // 2
+            if not self._less(self.heap[i], self.heap[parent]):
+                break
+            self._swap(i, parent)
+            i = parent
+
+    def _sift_down(self, i):
+        size = len(self.heap)
+        while True:
+            smallest = i
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < size and self._less(self.heap[child], self.heap[smallest]):
+                    smallest = child
+            if smallest == i:
+                break
+            self._swap(i, smallest)
+            i = smallest
+
+    def push(self, server_id, key):
+        self.keys[server_id] = key
+        self.positions[server_id] = len(self.heap)
+        self.heap.append(server_id)
+        self._sift_up(len(self.heap) - 1)
+
+    def update(self, server_id, key):
+        self.keys[server_id] = key
+        i = self.positions[server_id]
+        self._sift_up(i)
+        self._sift_down(self.positions[server_id])
+
+    def remove(self, server_id):
+        i = self.positions.pop(server_id)
+        last = self.heap.pop()
+        del self.keys[server_id]
+        if last != server_id:
+            self.heap[i] = last
+            self.positions[last] = i
+            self._sift_up(i)
+            self._sift_down(self.positions[last])
+
+    def top(self):
+        """(serveur, charge) au sommet du tas"""
+        server_id = self.heap[0]
+        return server_id, self.keys[server_id]
+
+
+# ============================================
+# ÉQUILIBREUR EN LIGNE
+# ============================================
+
+class OnlineLoadBalancer:
+    """
+    Équilibrage de charge en ligne : les tâches arrivent, changent de durée
+    et se terminent en continu. Chaque nouvelle tâche va au serveur le moins
+    chargé (règle gloutonne) ; chaque opération coûte O(log m) grâce à deux
+    tas indexés (moins chargé / plus chargé).
+
+    Les tâches sont stockées comme dans LoadBalancingSolution : un vecteur de
+    durées et un vecteur tâche → serveur (-1 une fois terminée), agrandis
+    par doublement. Les charges sont mises à jour avec la durée stockée
+    (convertie en dtype), celle que retirent complete_task et remove_server.
+    """
+    def __init__(self, n_servers, capacity=1024, dtype=np.int64):
+        self.durations = np.zeros(capacity, dtype=dtype)
+        self.task_server = np.full(capacity, -1, dtype=np.int32)
+        self.n_tasks = 0
+        self.server_loads = {}    # Serveur actif -> charge
+        self.server_tasks = {}    # Serveur actif -> tâches en cours
+        self.next_server_id = 0
+        self._min_heap = IndexedHeap(sign=1)
+        self._max_heap = IndexedHeap(sign=-1)
+        for _ in range(n_servers):
+            self.add_server()
+
+    @property
+    def n_servers(self):
+        return len(self.server_loads)
+
+    def _set_load(self, server_id, load):
+        self.server_loads[server_id] = load
+        self._min_heap.update(server_id, load)
+        self._max_heap.update(server_id, load)
+
+    def _grow(self):
+        capacity = 2 * len(self.durations)
+        self.durations = np.resize(self.durations, capacity)
+        task_server = np.full(capacity, -1, dtype=np.int32)
+        task_server[:self.n_tasks] = self.task_server[:self.n_tasks]
+        self.task_server = task_server
+
+    def _place(self, task_id, duration):
+        """Assigne une tâche au serveur le moins chargé"""
+        server_id, load = self._min_heap.top()
+        self.task_server[task_id] = server_id
+        self.server_tasks[server_id].add(task_id)
+        self._set_load(server_id, load + duration)
+        return server_id
+
+    def add_task(self, duration):
+        """Nouvelle tâche : retourne (task_id, serveur choisi)"""
+        if not self.server_loads:
+            raise RuntimeError("Aucun serveur actif")
+        if self.n_tasks == len(self.durations):
+            self._grow()
+        task_id = self.n_tasks
+        self.n_tasks += 1
+        self.durations[task_id] = duration
+        return task_id, self._place(task_id, self.durations[task_id].item())
+
+    def complete_task(self, task_id):
+        """Tâche terminée : sa durée est retirée de la charge de son serveur"""
+        server_id = int(self.task_server[task_id])
+        if server_id < 0:
+            raise KeyError(f"Tâche {task_id} inconnue ou déjà terminée")
+        self.task_server[task_id] = -1
+        self.server_tasks[server_id].discard(task_id)
+        self._set_load(server_id, self.server_loads[server_id] - self.durations[task_id].item())
+
+    def resize_task(self, task_id, duration):
+        """Nouvelle durée pour une tâche en cours (elle reste sur son serveur)"""
+        server_id = int(self.task_server[task_id])
+        if server_id < 0:
+            raise KeyError(f"Tâche {task_id} inconnue ou déjà terminée")
+        previous = self.durations[task_id].item()
+        self.durations[task_id] = duration
+        self._set_load(server_id, self.server_loads[server_id] + self.durations[task_id].item() - previous)
+
+    def add_server(self):
+        """Ajoute un serveur vide ; retourne son identifiant"""
+        server_id = self.next_server_id
+        self.next_server_id += 1
+        self.server_loads[server_id] = 0
+        self.server_tasks[server_id] = set()
+        self._min_heap.push(server_id, 0)
+        self._max_heap.push(server_id, 0)
+        return server_id
+
+    def remove_server(self, server_id):
+        """
+        Retire un serveur ; ses tâches en cours sont réassignées (plus longues
+        d'abord) aux serveurs restants, en O(log m) chacune.
+        """
+        if self.server_tasks[server_id] and self.n_servers == 1:
+            raise RuntimeError("Impossible de retirer le dernier serveur : des tâches sont en cours")
+        tasks = self.server_tasks.pop(server_id)
+        del self.server_loads[server_id]
+        self._min_heap.remove(server_id)
+        self._max_heap.remove(server_id)
+        for task_id in sorted(tasks, key=lambda t: -self.durations[t]):
+            self._place(task_id, self.durations[task_id].item())
+
+    def least_loaded(self):
+        """(serveur, charge) le moins chargé"""
+        return self._min_heap.top()
+
+    def most_loaded(self):
+        """(serveur, charge) le plus chargé"""
+        return self._max_heap.top()
+
+    def get_makespan(self):
+        return self._max_heap.top()[1] if self.server_loads else 0
+
+    def to_solution(self):
+        """
+        Instantané sous forme de LoadBalancingSolution : serveurs actifs
+        renumérotés 0..m-1, tâches terminées non assignées (-1).
+        """
+        servers = sorted(self.server_loads)
+        index = np.full(self.next_server_id + 1, -1, dtype=np.int32)
+        index[servers] = np.arange(len(servers))
+        task_server = index[self.task_server[:self.n_tasks]]  # -1 reste -1 (dernier élément)
+        return LoadBalancingSolution.from_assignment(len(servers), self.durations[:self.n_tasks], task_server)
+
+    def apply(self, event):
+        """
+        Applique un événement : ('add', durée), ('complete', task_id),
+        ('resize', task_id, durée), ('add_server',), ('remove_server', serveur)
+        """
+        kind = event[0]
+        if kind == 'add':
+            return self.add_task(event[1])
+        if kind == 'complete':
+            return self.complete_task(event[1])
+        if kind == 'resize':
+            return self.resize_task(event[1], event[2])
+        if kind == 'add_server':
+            return self.add_server()
+        if kind == 'remove_server':
+            return self.remove_server(event[1])
+        raise ValueError(f"Événement inconnu : {kind!r}")
+
+    def replay(self, events):
+        """
+        Rejoue un flux d'événements et mesure le débit.
+
+        Returns:
+            dict : nombre d'événements et d'assignations, temps écoulé,
+            assignations/s, événements/s et makespan final
+        """
+        n_events = 0
+        n_assignments = 0
+        start_time = time.perf_counter()
+        for event in events:
+            self.apply(event)
+            n_events += 1
+            if event[0] == 'add':
+                n_assignments += 1
+        elapsed_time = time.perf_counter() - start_time
+        return {
+            'n_events': n_events,
+            'n_assignments': n_assignments,
+            'elapsed_time': elapsed_time,
+            'assignments_per_second': n_assignments / elapsed_time if elapsed_time > 0 else float('inf'),
+            'events_per_second': n_events / elapsed_time if elapsed_time > 0 else float('inf'),
+            'makespan': self.get_makespan()
+        }
+
+
+def synthetic_stream(n_events, completion_rate=0.4, resize_rate=0.05, task_duration_range=(1, 100), seed=None):
+    """
+    Flux synthétique d'arrivées, de fins et de redimensionnements de tâches.
+    Les identifiants suivent ceux attribués par OnlineLoadBalancer.add_task
+    (0, 1, 2, ...) sur un équilibreur neuf.
+    """
+    rng = np.random.default_rng(seed)
+    kinds = rng.random(n_events)
+    durations = rng.integers(task_duration_range[0], task_duration_range[1] + 1, size=n_events).tolist()
+    active = []
+    next_task_id = 0
+    for kind, duration in zip(kinds.tolist(), durations):
+        if active and kind < completion_rate:
+            # Fin d'une tâche en cours choisie au hasard (retrait en O(1))
+            i = int(rng.integers(len(active)))
+            active[i], active[-1] = active[-1], active[i]
+            yield ('complete', active.pop())
+        elif active and kind < completion_rate + resize_rate:
+            yield ('resize', active[int(rng.integers(len(active)))], duration)
+        else:
+            yield ('add', duration)
+            active.append(next_task_id)
+            next_task_id += 1
+
+
+if __name__ == "__main__":
+    balancer = OnlineLoadBalancer(n_servers=100)
+    stats = balancer.replay(synthetic_stream(1_000_000, seed=42))
+    print(f"Événements          : {stats['n_events']}")
+    print(f"Assignations        : {stats['n_assignments']}")
+    print(f"Débit               : {stats['assignments_per_second']:.0f} assignations/s")
+    print(f"Makespan final      : {stats['makespan']}")
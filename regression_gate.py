@@ -0,0 +1,234 @@
+"""
+Garde-fou de performance : compare une exécution de la suite de référence
+(generate_benchmark_suite) à une baseline enregistrée.
+
+    python cli.py gate --update     Enregistre la baseline (benchmark_baseline.json)
+    python cli.py gate              Compare ; code de sortie 1 en cas de régression
+"""
+import json
+import os
+import platform
+import time
+import numpy as np
+
+from load_balancing_algorithms import (evaluate_algorithm, genetic_algorithm_load_balancing,
+                                       greedy_load_balancing, tabu_search_load_balancing)
+
+
+# 2 : tabou et GA mesurés sans arrêt à la borne (les baselines 1 ne sont plus comparables)
+BASELINE_FORMAT_VERSION = 2
+
+
+def reference_algorithms():
+    """
+    Algorithmes surveillés et paramètres figés : (fonction, nom, paramètres).
+    Le GA a une graine fixe, tous les makespans sont donc déterministes.
+
+    Tabou et GA tournent sans arrêt à la borne inférieure (stop_at_bound=False) :
+    sur les instances où le glouton atteint déjà la borne, ils s'arrêteraient
+    à l'itération 0 et le garde-fou ne chronométrerait pas la recherche.
+    """
+    return [
+        (greedy_load_balancing, 'greedy', {}),
+        (tabu_search_load_balancing, 'tabu', {'max_iterations': 100, 'tabu_tenure': 10, 'stop_at_bound': False}),
+        (genetic_algorithm_load_balancing, 'genetic',
+         {'population_size': 50, 'max_generations': 100, 'mutation_rate': 0.1, 'seed': 0,
+          'stop_at_bound': False}),
+    ]
+
+
+def machine_info():
+    """Machine et versions : les temps ne sont comparables que sur la même configuration"""
+    return {
+        'platform': platform.platform(),
+        'processor': platform.processor() or platform.machine(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+    }
+
+
+# ============================================
+# MESURE DE LA SUITE DE RÉFÉRENCE
+# ============================================
+
+def measure_reference_suite(repeats=5, warmup=1, algorithms=None, benchmark_suite=None):
+    """
+    Exécute chaque algorithme de référence sur chaque instance, un job à la
+    fois (pas de pool : les temps ne doivent pas se gêner).
+
+    Returns:
+        liste de dicts (instance_id, algorithm, makespan, médiane, IQR et
+        minimum des temps sur `repeats` exécutions, voir evaluate_algorithm)
+    """
+    if algorithms is None:
+        algorithms = reference_algorithms()
+    if benchmark_suite is None:
+        from generate_benchmark import generate_benchmark_suite
+        benchmark_suite = generate_benchmark_suite()
+
+    records = []
+    for instance in benchmark_suite:
+        for algo_func, algo_name, params in algorithms:
+            results, _ = evaluate_algorithm(algo_func, instance['tasks'], instance['n_servers'], algo_name,
+                                            repeats=repeats, warmup=warmup, measure_memory=False, **params)
+            records.append({
+                'instance_id': instance['id'],
+                'algorithm': algo_name,
+                'n_tasks': instance['n_tasks'],
+                'n_servers': instance['n_servers'],
+                'makespan': results['makespan'],
+                'execution_time': results['execution_time'],
+                'execution_time_iqr': results['execution_time_iqr'],
+                'execution_time_min': results['execution_time_min'],
+            })
+            print(f"  • {instance['id']:12s} {algo_name:8s} | Makespan: {results['makespan']:6.0f} | "
+                  f"Temps: {results['execution_time']:.4f}s ± {results['execution_time_iqr']:.4f}")
+    return records
+
+
+def save_baseline(records, path='benchmark_baseline.json', repeats=5, warmup=1):
+    """Écrit la baseline (écriture atomique via un fichier temporaire)"""
+    baseline = {
+        'format_version': BASELINE_FORMAT_VERSION,
+        'created_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+        'machine': machine_info(),
+        'settings': {'repeats': repeats, 'warmup': warmup},
+        'results': records,
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+    os.replace(tmp_path, path)
+    return baseline
+
+
+def load_baseline(path='benchmark_baseline.json'):
+    with open(path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('format_version') != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Format de baseline non supporté : {baseline.get('format_version')!r} "
+                         f"(réenregistrer avec gate --update)")
+    return baseline
+
+
+# ============================================
+# COMPARAISON AVEC SEUILS TENANT COMPTE DU BRUIT
+# ============================================
+
+def compare_to_baseline(baseline_records, current_records, time_tolerance=0.25, noise_factor=3.0,
+                        min_time_delta=0.001, makespan_tolerance=0.0):
+    """
+    Compare chaque couple (instance, algorithme) à la baseline.
+
+    Temps : régression si la médiane augmente de plus que
+        max(time_tolerance × médiane de base,
+            noise_factor × max(IQR de base, IQR courant),
+            min_time_delta)
+    le terme IQR absorbe le bruit mesuré, min_time_delta (s) celui des jobs
+    trop courts pour être chronométrés finement.
+    Qualité : régression si le makespan augmente de plus de
+    makespan_tolerance (fraction, 0 par défaut : les makespans sont
+    déterministes).
+
+    Returns:
+        liste de dicts (une ligne par couple, avec 'status' : 'ok', 'faster',
+        'better', 'slower', 'worse', 'missing' ou 'new')
+    """
+    current = {(record['instance_id'], record['algorithm']): record for record in current_records}
+    rows = []
+    for base in baseline_records:
+        key = (base['instance_id'], base['algorithm'])
+        row = {'instance_id': key[0], 'algorithm': key[1],
+               'base_makespan': base['makespan'], 'base_time': base['execution_time']}
+        record = current.pop(key, None)
+        if record is None:
+            rows.append(dict(row, status=['missing']))
+            continue
+
+        allowed_time = max(time_tolerance * base['execution_time'],
+                           noise_factor * max(base['execution_time_iqr'], record['execution_time_iqr']),
+                           min_time_delta)
+        time_delta = record['execution_time'] - base['execution_time']
+        makespan_delta = record['makespan'] - base['makespan']
+        allowed_makespan = makespan_tolerance * base['makespan']
+
+        status = []
+        if makespan_delta > allowed_makespan:
+            status.append('worse')
+        elif makespan_delta < 0:
+            status.append('better')
+        if time_delta > allowed_time:
+            status.append('slower')
+        elif -time_delta > allowed_time:
+            status.append('faster')
+        rows.append(dict(row, makespan=record['makespan'], time=record['execution_time'],
+                         time_ratio=record['execution_time'] / base['execution_time']
+                         if base['execution_time'] > 0 else float('nan'),
+                         allowed_time=allowed_time, status=status or ['ok']))
+    for key, record in current.items():
+        rows.append({'instance_id': key[0], 'algorithm': key[1], 'makespan': record['makespan'],
+                     'time': record['execution_time'], 'status': ['new']})
+    return rows
+
+
+def is_regression(row):
+    return any(status in ('worse', 'slower', 'missing') for status in row['status'])
+
+
+def print_diff(rows):
+    """Diff par instance : makespan et temps avant / après, verdict"""
+    print(f"\n{'Instance':12s} {'Algo':8s} | {'Makespan':>17s} | {'Temps (s)':>21s} {'Ratio':>6s} "
+          f"{'Seuil':>8s} | Statut")
+    print("-" * 100)
+    for row in rows:
+        makespan = f"{row.get('base_makespan', float('nan')):7.0f} → {row.get('makespan', float('nan')):7.0f}"
+        elapsed = f"{row.get('base_time', float('nan')):9.4f} → {row.get('time', float('nan')):9.4f}"
+        marker = '✗' if is_regression(row) else '✓'
+        print(f"{row['instance_id']:12s} {row['algorithm']:8s} | {makespan:>17s} | {elapsed:>21s} "
+              f"{row.get('time_ratio', float('nan')):5.2f}x {row.get('allowed_time', float('nan')):8.4f} | "
+              f"{marker} {', '.join(row['status'])}")
+
+
+# ============================================
+# COMMANDE
+# ============================================
+
+def run_gate(baseline_path='benchmark_baseline.json', update=False, repeats=5, warmup=1,
+             time_tolerance=0.25, noise_factor=3.0, min_time_delta=0.001, makespan_tolerance=0.0):
+    """
+    Mesure la suite de référence puis, selon le cas :
+    - update ou baseline absente : enregistre la baseline ;
+    - sinon : compare, affiche le diff par instance.
+
+    Returns:
+        code de sortie : 0 si aucune régression, 1 sinon
+    """
+    baseline = None
+    if not update:
+        if os.path.exists(baseline_path):
+            baseline = load_baseline(baseline_path)
+        else:
+            print(f"⚠️  Baseline '{baseline_path}' introuvable : elle va être créée")
+
+    print(f"⏱️  Suite de référence ({repeats} exécutions chronométrées, {warmup} d'échauffement)...\n")
+    records = measure_reference_suite(repeats=repeats, warmup=warmup)
+
+    if baseline is None:
+        save_baseline(records, baseline_path, repeats, warmup)
+        print(f"\n✅ Baseline enregistrée dans '{baseline_path}' ({len(records)} mesures)")
+        return 0
+
+    if baseline['machine'] != machine_info():
+        print(f"\n⚠️  Baseline mesurée sur une autre configuration ({baseline['machine']['platform']}, "
+              f"Python {baseline['machine']['python']}) : les temps sont indicatifs")
+    rows = compare_to_baseline(baseline['results'], records, time_tolerance, noise_factor,
+                               min_time_delta, makespan_tolerance)
+    print_diff(rows)
+
+    regressions = [row for row in rows if is_regression(row)]
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) par rapport à la baseline du {baseline['created_at']}")
+        return 1
+    print(f"\n✅ Aucune régression par rapport à la baseline du {baseline['created_at']}")
+    return 0
@@ -0,0 +1,181 @@
+"""
+Balayages de passage à l'échelle : tailles géométriques le long de n_tasks
+(n_servers fixé) puis de n_servers (n_tasks fixé), et ajustement empirique
+time ≈ c · n^a · m^b pour chaque algorithme.
+
+    python cli.py sweep --time-cap 5 --budget 1
+"""
+import inspect
+import numpy as np
+import pandas as pd
+
+from benchmark_stats import fit_power_law
+from large_scale_generator import sample_durations
+from load_balancing_algorithms import branch_and_bound_load_balancing, evaluate_algorithm
+
+
+def geometric_sizes(start, stop, n_points):
+    """Tailles entières espacées géométriquement entre start et stop (sans doublon)"""
+    return np.unique(np.geomspace(start, stop, n_points).round().astype(np.int64)).tolist()
+
+
+def sweep_algorithms(function_names=None):
+    """
+    Algorithmes balayés : ceux du benchmark (mêmes paramètres), sauf le
+    solveur exact dont le coût exponentiel n'a pas d'exposant à ajuster.
+    function_names : sous-ensemble par nom de fonction.
+    """
+    from benchmarking_complete import default_algorithms
+    return [
+        (algo_func, algo_name, params) for algo_func, algo_name, params in default_algorithms()
+        if algo_func is not branch_and_bound_load_balancing
+        and (function_names is None or algo_func.__name__ in function_names)
+    ]
+
+
+# ============================================
+# BALAYAGE
+# ============================================
+
+def sweep_series(algo_func, algo_name, params, axis, sizes, fixed, time_cap, repeats=1, seed=0):
+    """
+    Mesure un algorithme sur une série de tailles le long d'un axe
+    ('n_tasks' à n_servers = fixed, ou 'n_servers' à n_tasks = fixed).
+
+    La série s'arrête au premier point dont le temps médian dépasse
+    time_cap : ce point est gardé, les suivants ne sont pas lancés (avec un
+    espacement géométrique, le dépassement est borné par le facteur entre
+    deux tailles).
+
+    L'arrêt à la borne inférieure est désactivé (stop_at_bound=False) pour
+    les solveurs qui le proposent : sur ces instances, LPT atteint souvent
+    la borne et la recherche s'arrêterait à l'itération 0, le temps mesuré
+    serait alors celui du glouton et non celui du solveur.
+
+    Returns:
+        liste de dicts (un par point mesuré)
+    """
+    if 'stop_at_bound' in inspect.signature(algo_func).parameters:
+        params = dict(params, stop_at_bound=False)
+    points = []
+    for size in sizes:
+        n_tasks, n_servers = (size, fixed) if axis == 'n_tasks' else (fixed, size)
+        if n_servers > n_tasks:
+            break
+        # Même instance pour tous les algorithmes : graine dérivée de la taille
+        rng = np.random.default_rng([seed, n_tasks, n_servers])
+        tasks = sample_durations(rng, n_tasks)
+        # Échauffement au premier point seulement : coûts de premier appel hors mesure
+        results, _ = evaluate_algorithm(algo_func, tasks, n_servers, algo_name, repeats=repeats,
+                                        warmup=0 if points else 1, measure_memory=False, **params)
+        points.append({
+            'algorithm': algo_name,
+            'axis': axis,
+            'n_tasks': n_tasks,
+            'n_servers': n_servers,
+            'execution_time': results['execution_time'],
+            'makespan': results['makespan'],
+            'optimality_gap_%': results['optimality_gap_%'],
+        })
+        print(f"  • {algo_name:22s} n={n_tasks:>9} m={n_servers:>6} | Temps: {results['execution_time']:9.4f}s")
+        if results['execution_time'] > time_cap:
+            print(f"    ↳ plafond de {time_cap}s dépassé : fin de la série")
+            break
+    return points
+
+
+def run_sweep(algorithms=None, task_sizes=None, server_sizes=None, fixed_servers=10, fixed_tasks=5000,
+              time_cap=5.0, repeats=1, seed=0):
+    """
+    Balaie chaque algorithme le long de n_tasks puis de n_servers.
+
+    Args:
+        task_sizes: Tailles de l'axe n_tasks (défaut : 10^2 à 10^6, 9 points)
+        server_sizes: Tailles de l'axe n_servers (défaut : 2 à 1024, 10 points)
+        fixed_servers: n_servers pendant le balayage de n_tasks
+        fixed_tasks: n_tasks pendant le balayage de n_servers
+        time_cap: Temps maximal d'un point (s) avant d'arrêter la série
+
+    Returns:
+        DataFrame des points mesurés
+    """
+    if algorithms is None:
+        algorithms = sweep_algorithms()
+    if task_sizes is None:
+        task_sizes = geometric_sizes(100, 1_000_000, 9)
+    if server_sizes is None:
+        server_sizes = geometric_sizes(2, 1024, 10)
+
+    points = []
+    for algo_func, algo_name, params in algorithms:
+        print(f"\n📈 {algo_name}")
+        points += sweep_series(algo_func, algo_name, params, 'n_tasks', task_sizes, fixed_servers,
+                               time_cap, repeats, seed)
+        points += sweep_series(algo_func, algo_name, params, 'n_servers', server_sizes, fixed_tasks,
+                               time_cap, repeats, seed)
+    return pd.DataFrame(points)
+
+
+# ============================================
+# AJUSTEMENT ET TAILLE MAXIMALE SOUS BUDGET
+# ============================================
+
+def fit_complexity(points, budget, fixed_servers=10, min_time=1e-3, confidence=0.95):
+    """
+    Pour chaque algorithme : exposants a (n_tasks) et b (n_servers) de
+    time ≈ c · n^a · m^b avec leurs intervalles de confiance, et plus grande
+    instance résolue en moins de `budget` secondes sur chaque axe.
+
+    Les points plus rapides que min_time sont exclus de l'ajustement : à
+    cette échelle le temps mesuré est dominé par les coûts fixes.
+    predicted_max_tasks extrapole l'ajustement à n_servers = fixed_servers,
+    seulement si l'intervalle de confiance de a exclut 0.
+
+    Returns:
+        DataFrame indexé par algorithme
+    """
+    rows = {}
+    for algo_name, algo_points in points.groupby('algorithm', sort=False):
+        timed = algo_points[algo_points['execution_time'] >= min_time]
+        fit = fit_power_law(timed['n_tasks'], timed['n_servers'], timed['execution_time'], confidence)
+        within = algo_points[algo_points['execution_time'] <= budget]
+        row = {
+            'a (n_tasks)': np.nan, 'a_ci_low': np.nan, 'a_ci_high': np.nan,
+            'b (n_servers)': np.nan, 'b_ci_low': np.nan, 'b_ci_high': np.nan,
+            'c': np.nan, 'r2': np.nan, 'n_points': len(timed),
+            'max_tasks_within_budget': within.loc[within['axis'] == 'n_tasks', 'n_tasks'].max(),
+            'max_servers_within_budget': within.loc[within['axis'] == 'n_servers', 'n_servers'].max(),
+            'predicted_max_tasks': np.nan,
+        }
+        if fit is not None:
+            row.update({'a (n_tasks)': fit['a'], 'a_ci_low': fit['a_ci'][0], 'a_ci_high': fit['a_ci'][1],
+                        'b (n_servers)': fit['b'], 'b_ci_low': fit['b_ci'][0], 'b_ci_high': fit['b_ci'][1],
+                        'c': fit['c'], 'r2': fit['r2']})
+            if fit['a_ci'][0] > 0:
+                servers_factor = fixed_servers ** fit['b'] if not np.isnan(fit['b']) else 1.0
+                row['predicted_max_tasks'] = int((budget / (fit['c'] * servers_factor)) ** (1 / fit['a']))
+        rows[algo_name] = row
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+
+def _size(value):
+    return 'aucune' if np.isnan(value) else f"{value:.0f}"
+
+
+def print_fits(fits, budget, confidence=0.95):
+    print("\n" + "=" * 100)
+    print(f"🔬 COMPLEXITÉ EMPIRIQUE : time ≈ c · n^a · m^b (IC à {confidence:.0%}), budget {budget}s")
+    print("=" * 100)
+    for algo_name, row in fits.iterrows():
+        print(f"\n{algo_name}")
+        if np.isnan(row['c']):
+            print(f"  Trop peu de points mesurables ({row['n_points']:.0f}) pour l'ajustement")
+        else:
+            print(f"  a (n_tasks)   = {row['a (n_tasks)']:6.3f}  [{row['a_ci_low']:6.3f}, {row['a_ci_high']:6.3f}]")
+            print(f"  b (n_servers) = {row['b (n_servers)']:6.3f}  [{row['b_ci_low']:6.3f}, {row['b_ci_high']:6.3f}]")
+            print(f"  c = {row['c']:.3e}, R² = {row['r2']:.3f} ({row['n_points']:.0f} points)")
+        print(f"  Plus grande instance en moins de {budget}s : "
+              f"n_tasks = {_size(row['max_tasks_within_budget'])}, "
+              f"n_servers = {_size(row['max_servers_within_budget'])}"
+              + (f" (extrapolé : n_tasks ≈ {row['predicted_max_tasks']:.0f})"
+                 if not np.isnan(row['predicted_max_tasks']) else ""))
@@ -1,21 +1,21 @@
-import json
 import os
 import pandas as pd
 from datetime import datetime
 
+from instance_store import InstanceStore
+
 BENCH_JSON = 'load_balancing_benchmark.json'
 OUT_HTML = 'benchmark_overview.html'
 
 
 def load_benchmark(path=BENCH_JSON):
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return InstanceStore(path)
 
 
 def build_dataframe(bench):
     rows = []
     for inst in bench:
-        total = sum(inst['tasks'])
+        total = inst['total_load']
         lb = total / inst['n_servers']
         rows.append({
             'ID': inst.get('id', ''),